@@ -0,0 +1,243 @@
+"""Initial schema
+
+Revision ID: c9e1f47a5d02
+Revises:
+Create Date: 2026-08-27 10:14:32.518294
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c9e1f47a5d02'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(length=254), nullable=False),
+        sa.Column('username', sa.String(length=64), nullable=False),
+        sa.Column('full_name', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('job_role', sa.String(), nullable=True),
+        sa.Column('experience_level', sa.String(), nullable=True),
+        sa.Column('target_companies', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('notification_enabled', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('fcm_token', sa.String(), nullable=True),
+        sa.Column('notification_frequency', sa.Integer(), server_default=sa.text('10'), nullable=True),
+        sa.Column('notification_time', sa.String(length=5), server_default='09:00', nullable=True),
+        sa.Column('quiz_completion_goal', sa.Integer(), server_default=sa.text('1'), nullable=True),
+        sa.Column('timer_enabled', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('quiz_difficulty', sa.String(length=8), server_default='medium', nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_index('ix_users_target_companies_gin', 'users', ['target_companies'], unique=False, postgresql_using='gin')
+
+    op.create_table(
+        'topics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('is_default', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('difficulty_level', sa.String(length=8), server_default='medium', nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_topics_id'), 'topics', ['id'], unique=False)
+    op.create_index(op.f('ix_topics_name'), 'topics', ['name'], unique=True)
+
+    op.create_table(
+        'user_topics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('topic_id', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('priority', sa.Integer(), server_default=sa.text('1'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['topic_id'], ['topics.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_topics_id'), 'user_topics', ['id'], unique=False)
+
+    op.create_table(
+        'questions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('topic_id', sa.Integer(), nullable=False),
+        sa.Column('question_text', sa.Text(), nullable=False),
+        sa.Column('question_type', sa.String(length=16), server_default='mcq', nullable=True),
+        sa.Column('difficulty_level', sa.String(length=8), server_default='medium', nullable=True),
+        sa.Column('options', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('correct_answer', sa.String(), nullable=True),
+        sa.Column('source_url', sa.String(), nullable=True),
+        sa.Column('source_name', sa.String(), nullable=True),
+        sa.Column('company_name', sa.String(), nullable=True),
+        sa.Column('ai_answer', sa.Text(), nullable=True),
+        sa.Column('ai_explanation', sa.Text(), nullable=True),
+        sa.Column('ai_confidence_score', sa.Float(), nullable=True),
+        sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('estimated_time', sa.Integer(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('verification_score', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['topic_id'], ['topics.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_questions_id'), 'questions', ['id'], unique=False)
+    op.create_index('ix_questions_topic_difficulty', 'questions', ['topic_id', 'difficulty_level'], unique=False)
+    op.create_index('ix_questions_verified', 'questions', ['is_verified'], unique=False)
+    op.create_index('ix_questions_tags_gin', 'questions', ['tags'], unique=False, postgresql_using='gin')
+
+    op.create_table(
+        'quiz_attempts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('quiz_type', sa.String(length=16), server_default='daily', nullable=True),
+        sa.Column('total_questions', sa.Integer(), nullable=False),
+        sa.Column('completed_questions', sa.Integer(), server_default=sa.text('0'), nullable=True),
+        sa.Column('correct_answers', sa.Integer(), server_default=sa.text('0'), nullable=True),
+        sa.Column('total_time_taken', sa.Integer(), nullable=True),
+        sa.Column('timer_enabled', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('status', sa.String(length=16), server_default='in_progress', nullable=True),
+        sa.Column('score_percentage', sa.Float(), nullable=True),
+        sa.Column('topics_covered', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('difficulty_breakdown', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_attempts_id'), 'quiz_attempts', ['id'], unique=False)
+    op.create_index('ix_quiz_attempts_user_status', 'quiz_attempts', ['user_id', 'status'], unique=False)
+
+    op.create_table(
+        'quiz_questions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('quiz_attempt_id', sa.Integer(), nullable=False),
+        sa.Column('question_id', sa.Integer(), nullable=False),
+        sa.Column('user_answer', sa.String(), nullable=True),
+        sa.Column('is_correct', sa.Boolean(), nullable=True),
+        sa.Column('time_taken', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['question_id'], ['questions.id']),
+        sa.ForeignKeyConstraint(['quiz_attempt_id'], ['quiz_attempts.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_quiz_questions_id'), 'quiz_questions', ['id'], unique=False)
+
+    op.create_table(
+        'daily_quiz_schedules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('scheduled_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('questions_per_topic', sa.Integer(), server_default=sa.text('1'), nullable=True),
+        sa.Column('is_completed', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('quiz_attempt_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['quiz_attempt_id'], ['quiz_attempts.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_daily_quiz_schedules_id'), 'daily_quiz_schedules', ['id'], unique=False)
+    op.create_index('ix_daily_quiz_schedules_user_date', 'daily_quiz_schedules', ['user_id', 'scheduled_date'], unique=False)
+
+    op.create_table(
+        'daily_quiz_topics',
+        sa.Column('schedule_id', sa.Integer(), nullable=False),
+        sa.Column('topic_id', sa.Integer(), nullable=False),
+        sa.Column('slot', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['schedule_id'], ['daily_quiz_schedules.id']),
+        sa.ForeignKeyConstraint(['topic_id'], ['topics.id']),
+        sa.PrimaryKeyConstraint('schedule_id', 'topic_id')
+    )
+    op.create_index('ix_daily_quiz_topics_topic', 'daily_quiz_topics', ['topic_id'], unique=False)
+
+    op.create_table(
+        'notifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('notification_type', sa.String(length=32), nullable=False),
+        sa.Column('is_sent', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('is_read', sa.Boolean(), server_default=sa.text('false'), nullable=True),
+        sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('fcm_token', sa.String(), nullable=True),
+        sa.Column('fcm_message_id', sa.String(), nullable=True),
+        sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notifications_id'), 'notifications', ['id'], unique=False)
+    op.create_index('ix_notifications_user_sent', 'notifications', ['user_id', 'is_sent'], unique=False)
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+
+    op.create_table(
+        'notification_schedules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('notification_type', sa.String(length=32), nullable=False),
+        sa.Column('scheduled_time', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('frequency', sa.String(length=16), server_default='daily', nullable=True),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text('true'), nullable=True),
+        sa.Column('last_sent', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_send', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('title_template', sa.String(), nullable=False),
+        sa.Column('message_template', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notification_schedules_id'), 'notification_schedules', ['id'], unique=False)
+    op.create_index('ix_notification_schedules_next', 'notification_schedules', ['is_active', 'next_send'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_schedules_next', table_name='notification_schedules')
+    op.drop_index(op.f('ix_notification_schedules_id'), table_name='notification_schedules')
+    op.drop_table('notification_schedules')
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_notifications_user_sent', table_name='notifications')
+    op.drop_index(op.f('ix_notifications_id'), table_name='notifications')
+    op.drop_table('notifications')
+    op.drop_index('ix_daily_quiz_topics_topic', table_name='daily_quiz_topics')
+    op.drop_table('daily_quiz_topics')
+    op.drop_index('ix_daily_quiz_schedules_user_date', table_name='daily_quiz_schedules')
+    op.drop_index(op.f('ix_daily_quiz_schedules_id'), table_name='daily_quiz_schedules')
+    op.drop_table('daily_quiz_schedules')
+    op.drop_index(op.f('ix_quiz_questions_id'), table_name='quiz_questions')
+    op.drop_table('quiz_questions')
+    op.drop_index('ix_quiz_attempts_user_status', table_name='quiz_attempts')
+    op.drop_index(op.f('ix_quiz_attempts_id'), table_name='quiz_attempts')
+    op.drop_table('quiz_attempts')
+    op.drop_index('ix_questions_tags_gin', table_name='questions')
+    op.drop_index('ix_questions_verified', table_name='questions')
+    op.drop_index('ix_questions_topic_difficulty', table_name='questions')
+    op.drop_index(op.f('ix_questions_id'), table_name='questions')
+    op.drop_table('questions')
+    op.drop_index(op.f('ix_user_topics_id'), table_name='user_topics')
+    op.drop_table('user_topics')
+    op.drop_index(op.f('ix_topics_name'), table_name='topics')
+    op.drop_index(op.f('ix_topics_id'), table_name='topics')
+    op.drop_table('topics')
+    op.drop_index('ix_users_target_companies_gin', table_name='users')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_table('users')
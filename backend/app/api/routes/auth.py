@@ -10,7 +10,7 @@ from app.core.database import get_db
 from app.core.config import settings
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserResponse, Token, UserLogin
-from app.services.notification import NotificationService
+from app.services.notification import notification_service
 
 router = APIRouter()
 
@@ -92,7 +92,6 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     await db.refresh(db_user)
     
     # Set up default notification schedule
-    notification_service = NotificationService()
     await notification_service.setup_daily_notifications(db_user.id, db)
     
     return UserResponse.from_orm(db_user)
@@ -1,13 +1,30 @@
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import MetaData
+from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
-# Create async engine
+# Create async engine with an explicitly sized connection pool so requests
+# reuse warm connections instead of paying a TCP+TLS handshake per query
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_pre_ping=True,  # Detect stale connections before handing them out
+    pool_recycle=1800,  # Recycle connections before server-side timeouts hit
+    # asyncpg caches prepared statements per connection; repeated query
+    # shapes skip parse/plan. Set both caches to 0 behind pgbouncer in
+    # transaction mode.
+    connect_args={
+        "statement_cache_size": 500,
+        "prepared_statement_cache_size": 500
+    },
+    # Serialize JSONB payloads (options, tags, notification data, ...) with
+    # orjson instead of stdlib json on every insert/update
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads
 )
 
 # Create async session factory
@@ -18,7 +35,8 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 # Create base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 # Dependency to get database session
 async def get_db():
@@ -1,13 +1,19 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
+import orjson
 from contextlib import asynccontextmanager
 import logging
+import os
 
 from app.core.config import settings
 from app.core.database import engine, Base
 from app.api.routes import auth, users, topics, questions, quizzes, analytics, notifications
 from app.services.scheduler import start_scheduler
+from app.services.ai_service import ai_service
+from app.services.notification import notification_service
+from app.services.scraper import close_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,24 +23,46 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Interview Prep App...")
-    
-    # Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    # Start background scheduler
-    start_scheduler()
+
+    # Schema is managed by Alembic (run `alembic upgrade head` before boot).
+    # Only fall back to create_all for throwaway SQLite databases in debug.
+    if settings.DEBUG and settings.DATABASE_URL.startswith("sqlite"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    # Precompute constant endpoint payloads so probe traffic skips
+    # per-request serialization entirely
+    app.state.root_bytes = orjson.dumps({
+        "message": "Interview Prep App API",
+        "version": settings.APP_VERSION,
+        "docs": "/docs"
+    })
+    app.state.health_bytes = orjson.dumps({
+        "status": "healthy",
+        "version": settings.APP_VERSION
+    })
+
+    # The scheduler runs in a dedicated worker process (worker.py) so
+    # multi-worker API deployments don't spawn competing schedulers.
+    # ROLE=scheduler restores the old in-process behavior for local dev.
+    if os.getenv("ROLE") == "scheduler":
+        start_scheduler()
     
     yield
-    
+
     # Shutdown
     logger.info("Shutting down Interview Prep App...")
+    await ai_service.aclose()
+    await notification_service.aclose()
+    await close_http_client()
+    await engine.dispose()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Interview and Placement Preparation Platform",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -60,15 +88,15 @@ app.include_router(notifications.router, prefix="/api/notifications", tags=["Not
 
 @app.get("/")
 async def root():
-    return {
-        "message": "Interview Prep App API",
-        "version": settings.APP_VERSION,
-        "docs": "/docs"
-    }
+    return Response(content=app.state.root_bytes, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": settings.APP_VERSION}
+    return Response(
+        content=app.state.health_bytes,
+        media_type="application/json",
+        headers={"Cache-Control": "max-age=5"}
+    )
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,7 +1,7 @@
 from .user import User
 from .topic import Topic, UserTopic
 from .question import Question, QuizQuestion
-from .quiz import QuizAttempt, DailyQuizSchedule
+from .quiz import QuizAttempt, DailyQuizSchedule, DailyQuizTopic
 from .notification import Notification, NotificationSchedule
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "QuizQuestion",
     "QuizAttempt",
     "DailyQuizSchedule",
+    "DailyQuizTopic",
     "Notification",
     "NotificationSchedule"
 ]
\ No newline at end of file
@@ -1,59 +1,74 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, true, false
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    
+    __table_args__ = (
+        # Notification list/badge queries filter by user and sent state
+        Index("ix_notifications_user_sent", "user_id", "is_sent"),
+        # Keyset pagination over a user's feed seeks on (created_at, id);
+        # Postgres scans the btree backwards for the DESC ordering
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
     # Notification content
-    title = Column(String, nullable=False)
-    message = Column(Text, nullable=False)
-    notification_type = Column(String, nullable=False)  # quiz_reminder, achievement, system
-    
+    title: Mapped[str]
+    message: Mapped[str] = mapped_column(Text)
+    notification_type: Mapped[str] = mapped_column(String(32))  # quiz_reminder, achievement, system
+
     # Delivery details
-    is_sent = Column(Boolean, default=False)
-    is_read = Column(Boolean, default=False)
-    sent_at = Column(DateTime(timezone=True), nullable=True)
-    read_at = Column(DateTime(timezone=True), nullable=True)
-    
+    is_sent: Mapped[Optional[bool]] = mapped_column(server_default=false())
+    is_read: Mapped[Optional[bool]] = mapped_column(server_default=false())
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # Firebase specific
-    fcm_token = Column(String, nullable=True)
-    fcm_message_id = Column(String, nullable=True)
-    
+    fcm_token: Mapped[Optional[str]]
+    fcm_message_id: Mapped[Optional[str]]
+
     # Additional data
-    data = Column(JSON, nullable=True)  # Extra data for the notification
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+    data: Mapped[Optional[dict]] = mapped_column(JSONB)  # Extra data for the notification
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
     # Relationships
-    user = relationship("User", back_populates="notifications")
+    user: Mapped["User"] = relationship(back_populates="notifications")
 
 class NotificationSchedule(Base):
     __tablename__ = "notification_schedules"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    
+    __table_args__ = (
+        # The scheduler polls for active schedules that are due
+        Index("ix_notification_schedules_next", "is_active", "next_send"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
     # Schedule details
-    notification_type = Column(String, nullable=False)
-    scheduled_time = Column(DateTime(timezone=True), nullable=False)
-    frequency = Column(String, default="daily")  # daily, weekly, monthly
-    
+    notification_type: Mapped[str] = mapped_column(String(32))
+    scheduled_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    frequency: Mapped[Optional[str]] = mapped_column(String(16), server_default="daily")  # daily, weekly, monthly
+
     # Status
-    is_active = Column(Boolean, default=True)
-    last_sent = Column(DateTime(timezone=True), nullable=True)
-    next_send = Column(DateTime(timezone=True), nullable=True)
-    
+    is_active: Mapped[Optional[bool]] = mapped_column(server_default=true())
+    last_sent: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    next_send: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # Content template
-    title_template = Column(String, nullable=False)
-    message_template = Column(Text, nullable=False)
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    title_template: Mapped[str]
+    message_template: Mapped[str] = mapped_column(Text)
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
     # Relationships
-    user = relationship("User")
\ No newline at end of file
+    user: Mapped["User"] = relationship()
@@ -1,60 +1,71 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Float
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, false
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
 class Question(Base):
     __tablename__ = "questions"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    topic_id = Column(Integer, ForeignKey("topics.id"), nullable=False)
-    
+    __table_args__ = (
+        # Quiz building filters by topic and difficulty together
+        Index("ix_questions_topic_difficulty", "topic_id", "difficulty_level"),
+        Index("ix_questions_verified", "is_verified"),
+        # GIN index so tag containment queries (tags @> ...) use the index
+        Index("ix_questions_tags_gin", "tags", postgresql_using="gin"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id"))
+
     # Question content
-    question_text = Column(Text, nullable=False)
-    question_type = Column(String, default="mcq")  # mcq, coding, descriptive
-    difficulty_level = Column(String, default="medium")  # easy, medium, hard
-    
+    question_text: Mapped[str] = mapped_column(Text)
+    question_type: Mapped[Optional[str]] = mapped_column(String(16), server_default="mcq")  # mcq, coding, descriptive
+    difficulty_level: Mapped[Optional[str]] = mapped_column(String(8), server_default="medium")  # easy, medium, hard
+
     # MCQ specific fields
-    options = Column(JSON, nullable=True)  # List of options for MCQ
-    correct_answer = Column(String, nullable=True)  # Correct option or answer
-    
+    options: Mapped[Optional[list]] = mapped_column(JSONB)  # List of options for MCQ
+    correct_answer: Mapped[Optional[str]]  # Correct option or answer
+
     # Source information
-    source_url = Column(String, nullable=True)
-    source_name = Column(String, nullable=True)  # tcyonline, prepinsta, etc.
-    company_name = Column(String, nullable=True)  # If from company-specific interview
-    
+    source_url: Mapped[Optional[str]]
+    source_name: Mapped[Optional[str]]  # tcyonline, prepinsta, etc.
+    company_name: Mapped[Optional[str]]  # If from company-specific interview
+
     # AI-generated content
-    ai_answer = Column(Text, nullable=True)
-    ai_explanation = Column(Text, nullable=True)
-    ai_confidence_score = Column(Float, nullable=True)  # 0.0 to 1.0
-    
+    ai_answer: Mapped[Optional[str]] = mapped_column(Text)
+    ai_explanation: Mapped[Optional[str]] = mapped_column(Text)
+    ai_confidence_score: Mapped[Optional[float]]  # 0.0 to 1.0
+
     # Metadata
-    tags = Column(JSON, nullable=True)  # List of tags
-    estimated_time = Column(Integer, nullable=True)  # Time in seconds
-    is_verified = Column(Boolean, default=False)
-    verification_score = Column(Float, nullable=True)  # Community/AI verification score
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    tags: Mapped[Optional[list]] = mapped_column(JSONB)  # List of tags
+    estimated_time: Mapped[Optional[int]]  # Time in seconds
+    is_verified: Mapped[Optional[bool]] = mapped_column(server_default=false())
+    verification_score: Mapped[Optional[float]]  # Community/AI verification score
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # Relationships
-    topic = relationship("Topic", back_populates="questions")
-    quiz_questions = relationship("QuizQuestion", back_populates="question")
+    topic: Mapped["Topic"] = relationship(back_populates="questions")
+    quiz_questions: Mapped[List["QuizQuestion"]] = relationship(back_populates="question", lazy="raise")
 
 class QuizQuestion(Base):
     __tablename__ = "quiz_questions"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    quiz_attempt_id = Column(Integer, ForeignKey("quiz_attempts.id"), nullable=False)
-    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    quiz_attempt_id: Mapped[int] = mapped_column(ForeignKey("quiz_attempts.id"))
+    question_id: Mapped[int] = mapped_column(ForeignKey("questions.id"))
+
     # User's response
-    user_answer = Column(String, nullable=True)
-    is_correct = Column(Boolean, nullable=True)
-    time_taken = Column(Integer, nullable=True)  # Time in seconds
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+    user_answer: Mapped[Optional[str]]
+    is_correct: Mapped[Optional[bool]]
+    time_taken: Mapped[Optional[int]]  # Time in seconds
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
     # Relationships
-    quiz_attempt = relationship("QuizAttempt", back_populates="quiz_questions")
-    question = relationship("Question", back_populates="quiz_questions")
\ No newline at end of file
+    quiz_attempt: Mapped["QuizAttempt"] = relationship(back_populates="quiz_questions")
+    question: Mapped["Question"] = relationship(back_populates="quiz_questions")
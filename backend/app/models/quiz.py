@@ -1,56 +1,94 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Float
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, true, false, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    
+    __table_args__ = (
+        # Dashboard and analytics list a user's attempts filtered by status
+        Index("ix_quiz_attempts_user_status", "user_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
     # Quiz metadata
-    quiz_type = Column(String, default="daily")  # daily, practice, mock
-    total_questions = Column(Integer, nullable=False)
-    completed_questions = Column(Integer, default=0)
-    correct_answers = Column(Integer, default=0)
-    
+    quiz_type: Mapped[Optional[str]] = mapped_column(String(16), server_default="daily")  # daily, practice, mock
+    total_questions: Mapped[int]
+    completed_questions: Mapped[Optional[int]] = mapped_column(server_default=text("0"))
+    correct_answers: Mapped[Optional[int]] = mapped_column(server_default=text("0"))
+
     # Timing
-    total_time_taken = Column(Integer, nullable=True)  # Total time in seconds
-    timer_enabled = Column(Boolean, default=True)
-    
+    total_time_taken: Mapped[Optional[int]]  # Total time in seconds
+    timer_enabled: Mapped[Optional[bool]] = mapped_column(server_default=true())
+
     # Status
-    status = Column(String, default="in_progress")  # in_progress, completed, abandoned
-    score_percentage = Column(Float, nullable=True)
-    
+    status: Mapped[Optional[str]] = mapped_column(String(16), server_default="in_progress")  # in_progress, completed, abandoned
+    score_percentage: Mapped[Optional[float]]
+
     # Analytics
-    topics_covered = Column(JSON, nullable=True)  # List of topic IDs
-    difficulty_breakdown = Column(JSON, nullable=True)  # easy/medium/hard counts
-    
-    started_at = Column(DateTime(timezone=True), server_default=func.now())
-    completed_at = Column(DateTime(timezone=True), nullable=True)
-    
+    topics_covered: Mapped[Optional[list]] = mapped_column(JSONB)  # List of topic IDs
+    difficulty_breakdown: Mapped[Optional[dict]] = mapped_column(JSONB)  # easy/medium/hard counts
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # Relationships
-    user = relationship("User", back_populates="quiz_attempts")
-    quiz_questions = relationship("QuizQuestion", back_populates="quiz_attempt", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship(back_populates="quiz_attempts")
+    quiz_questions: Mapped[List["QuizQuestion"]] = relationship(back_populates="quiz_attempt", cascade="all, delete-orphan", lazy="raise")
 
 class DailyQuizSchedule(Base):
     __tablename__ = "daily_quiz_schedules"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    
+    __table_args__ = (
+        # Scheduler checks per-user schedules for a given day
+        Index("ix_daily_quiz_schedules_user_date", "user_id", "scheduled_date"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+
     # Schedule details
-    scheduled_date = Column(DateTime(timezone=True), nullable=False)
-    topics = Column(JSON, nullable=False)  # List of topic IDs for the day
-    questions_per_topic = Column(Integer, default=1)
-    
+    scheduled_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    questions_per_topic: Mapped[Optional[int]] = mapped_column(server_default=text("1"))
+
     # Status
-    is_completed = Column(Boolean, default=False)
-    quiz_attempt_id = Column(Integer, ForeignKey("quiz_attempts.id"), nullable=True)
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+    is_completed: Mapped[Optional[bool]] = mapped_column(server_default=false())
+    quiz_attempt_id: Mapped[Optional[int]] = mapped_column(ForeignKey("quiz_attempts.id"))
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    user: Mapped["User"] = relationship()
+    quiz_attempt: Mapped[Optional["QuizAttempt"]] = relationship()
+    topic_links: Mapped[List["DailyQuizTopic"]] = relationship(
+        back_populates="schedule",
+        cascade="all, delete-orphan",
+        order_by="DailyQuizTopic.slot",
+        lazy="raise"
+    )
+
+class DailyQuizTopic(Base):
+    """One (schedule, topic) row per slot of a day's quiz.
+
+    Replaces the JSONB topic-id list on DailyQuizSchedule: join rows can
+    be indexed for per-topic analytics and bulk-inserted in one
+    statement, where the array column forced a full read of every list
+    just to count topics.
+    """
+    __tablename__ = "daily_quiz_topics"
+    __table_args__ = (
+        # Per-topic analytics scan by topic across schedules
+        Index("ix_daily_quiz_topics_topic", "topic_id"),
+    )
+
+    schedule_id: Mapped[int] = mapped_column(ForeignKey("daily_quiz_schedules.id"), primary_key=True)
+    topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id"), primary_key=True)
+    slot: Mapped[int]  # Position of the topic within the day's quiz
+
     # Relationships
-    user = relationship("User")
-    quiz_attempt = relationship("QuizAttempt")
\ No newline at end of file
+    schedule: Mapped["DailyQuizSchedule"] = relationship(back_populates="topic_links")
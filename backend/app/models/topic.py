@@ -1,36 +1,39 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, true, false, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
 class Topic(Base):
     __tablename__ = "topics"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, index=True, nullable=False)
-    description = Column(Text, nullable=True)
-    category = Column(String, nullable=False)  # programming, aptitude, technical, hr, etc.
-    is_default = Column(Boolean, default=False)  # System-defined topics
-    difficulty_level = Column(String, default="medium")  # easy, medium, hard
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(unique=True, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    category: Mapped[str]  # programming, aptitude, technical, hr, etc.
+    is_default: Mapped[Optional[bool]] = mapped_column(server_default=false())  # System-defined topics
+    difficulty_level: Mapped[Optional[str]] = mapped_column(String(8), server_default="medium")  # easy, medium, hard
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # Relationships
-    user_topics = relationship("UserTopic", back_populates="topic")
-    questions = relationship("Question", back_populates="topic")
+    user_topics: Mapped[List["UserTopic"]] = relationship(back_populates="topic", lazy="raise")
+    questions: Mapped[List["Question"]] = relationship(back_populates="topic", lazy="raise")
 
 class UserTopic(Base):
     __tablename__ = "user_topics"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    topic_id = Column(Integer, ForeignKey("topics.id"), nullable=False)
-    is_active = Column(Boolean, default=True)
-    priority = Column(Integer, default=1)  # 1-5, higher number = higher priority
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id"))
+    is_active: Mapped[Optional[bool]] = mapped_column(server_default=true())
+    priority: Mapped[Optional[int]] = mapped_column(server_default=text("1"))  # 1-5, higher number = higher priority
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
     # Relationships
-    user = relationship("User", back_populates="user_topics")
-    topic = relationship("Topic", back_populates="user_topics")
\ No newline at end of file
+    user: Mapped["User"] = relationship(back_populates="user_topics")
+    topic: Mapped["Topic"] = relationship(back_populates="user_topics")
@@ -1,38 +1,47 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import DateTime, Index, String, true, false, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 
 class User(Base):
     __tablename__ = "users"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
-    full_name = Column(String, nullable=False)
-    hashed_password = Column(String, nullable=False)
-    is_active = Column(Boolean, default=True)
-    is_verified = Column(Boolean, default=False)
-    
+    __table_args__ = (
+        # GIN index for target-company containment filters
+        Index("ix_users_target_companies_gin", "target_companies", postgresql_using="gin"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String(254), unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    full_name: Mapped[str]
+    hashed_password: Mapped[str]
+    is_active: Mapped[Optional[bool]] = mapped_column(server_default=true())
+    is_verified: Mapped[Optional[bool]] = mapped_column(server_default=false())
+
     # Profile information
-    job_role = Column(String, nullable=True)
-    experience_level = Column(String, nullable=True)  # fresher, 1-3, 3-5, 5+
-    target_companies = Column(JSON, nullable=True)  # List of company names
-    
+    job_role: Mapped[Optional[str]]
+    experience_level: Mapped[Optional[str]]  # fresher, 1-3, 3-5, 5+
+    target_companies: Mapped[Optional[list]] = mapped_column(JSONB)  # List of company names
+
     # Notification preferences
-    notification_enabled = Column(Boolean, default=True)
-    notification_frequency = Column(Integer, default=10)  # Number of notifications per day
-    notification_time = Column(String, default="09:00")  # Preferred notification time
-    quiz_completion_goal = Column(Integer, default=1)  # Daily quiz completion goal
-    
+    notification_enabled: Mapped[Optional[bool]] = mapped_column(server_default=true())
+    fcm_token: Mapped[Optional[str]]  # Device registration token for push delivery
+    notification_frequency: Mapped[Optional[int]] = mapped_column(server_default=text("10"))  # Number of notifications per day
+    notification_time: Mapped[Optional[str]] = mapped_column(String(5), server_default="09:00")  # Preferred notification time
+    quiz_completion_goal: Mapped[Optional[int]] = mapped_column(server_default=text("1"))  # Daily quiz completion goal
+
     # Settings
-    timer_enabled = Column(Boolean, default=True)
-    quiz_difficulty = Column(String, default="medium")  # easy, medium, hard
-    
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    timer_enabled: Mapped[Optional[bool]] = mapped_column(server_default=true())
+    quiz_difficulty: Mapped[Optional[str]] = mapped_column(String(8), server_default="medium")  # easy, medium, hard
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+
     # Relationships
-    user_topics = relationship("UserTopic", back_populates="user", cascade="all, delete-orphan")
-    quiz_attempts = relationship("QuizAttempt", back_populates="user", cascade="all, delete-orphan")
-    notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    user_topics: Mapped[List["UserTopic"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    quiz_attempts: Mapped[List["QuizAttempt"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="raise")
+    notifications: Mapped[List["Notification"]] = relationship(back_populates="user", cascade="all, delete-orphan", lazy="raise")
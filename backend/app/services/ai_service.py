@@ -1,14 +1,146 @@
+import asyncio
+import hashlib
 import httpx
-import json
+import orjson
+import re
+import redis.asyncio as aioredis
 from typing import Dict, List, Optional, Tuple
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from string import Template
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# LLM responses are deterministic enough at low temperature to cache for a week
+AI_CACHE_TTL = 604800
+
+# Models often wrap the requested JSON in prose; grab the object itself
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+def _extract_json(content: str):
+    """Parse the first JSON object in an LLM reply, ignoring surrounding prose"""
+    match = _JSON_RE.search(content)
+    if match is None:
+        raise orjson.JSONDecodeError("no JSON object found", content, 0)
+    return orjson.loads(match.group())
+
+# Prompt templates and system messages are assembled once at import time so
+# each call only pays for a single substitution
+_LETTERS = tuple(chr(65 + i) for i in range(26))
+
+def _format_options(options: List[str]) -> str:
+    return "\n".join(f"{_LETTERS[i]}. {options[i]}" for i in range(len(options)))
+
+_MCQ_PROMPT = Template("""
+Question: $question
+
+Options:
+$options_text
+
+Please provide:
+1. The correct answer (A, B, C, or D)
+2. A detailed explanation of why this answer is correct
+3. Your confidence level (0.0 to 1.0)
+4. Step-by-step reasoning
+
+Format your response as JSON:
+{
+    "answer": "A",
+    "explanation": "Detailed explanation here...",
+    "confidence_score": 0.95,
+    "reasoning": "Step by step reasoning..."
+}
+""")
+
+_OPEN_PROMPT = Template("""
+Question: $question
+
+Please provide:
+1. A comprehensive answer to this question
+2. A detailed explanation
+3. Your confidence level (0.0 to 1.0)
+4. Step-by-step reasoning
+
+Format your response as JSON:
+{
+    "answer": "Your answer here...",
+    "explanation": "Detailed explanation here...",
+    "confidence_score": 0.95,
+    "reasoning": "Step by step reasoning..."
+}
+""")
+
+_VALIDATE_MCQ_PROMPT = Template("""
+Question: $question
+
+Options:
+$options_text
+
+Scraped Answer: $scraped_answer
+
+Please validate if the scraped answer is correct. Provide:
+1. Is the answer correct? (true/false)
+2. Confidence score (0.0 to 1.0)
+3. Explanation of your validation
+
+Format as JSON:
+{
+    "is_correct": true,
+    "confidence_score": 0.95,
+    "explanation": "Validation explanation..."
+}
+""")
+
+_VALIDATE_OPEN_PROMPT = Template("""
+Question: $question
+Scraped Answer: $scraped_answer
+
+Please validate if this answer is reasonable and correct. Provide:
+1. Is the answer correct? (true/false)
+2. Confidence score (0.0 to 1.0)
+3. Explanation of your validation
+
+Format as JSON:
+{
+    "is_correct": true,
+    "confidence_score": 0.95,
+    "explanation": "Validation explanation..."
+}
+""")
+
+_IMPROVE_PROMPT = Template("""
+Original Question: $question
+Context: $context
+
+Please improve this question to make it:
+1. More clear and specific
+2. Grammatically correct
+3. Professional and interview-appropriate
+4. Maintain the original intent
+
+Return only the improved question text.
+""")
+
+_GENERATE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert interview preparation assistant. Provide accurate, well-reasoned answers to interview questions with detailed explanations."
+}
+
+_VALIDATE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert validator for interview questions and answers. Carefully analyze the correctness of provided answers."
+}
+
+_IMPROVE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert at improving interview questions for clarity and professionalism."
+}
+
+# slots avoids a per-instance __dict__ for the many answers a scrape run
+# allocates; frozen makes instances hashable for dedupe/caching
+@dataclass(slots=True, frozen=True)
 class AIAnswer:
     answer: str
     explanation: str
@@ -19,190 +151,182 @@ class AIService:
     def __init__(self):
         self.api_key = settings.OPENROUTER_API_KEY
         self.base_url = "https://openrouter.ai/api/v1"
+        self.model = "anthropic/claude-3.5-sonnet"  # Using Claude for better reasoning
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://interview-prep-app.com",
             "X-Title": "Interview Prep App"
         }
+        # Persistent client so every call reuses the same connection pool
+        # instead of paying DNS + TCP + TLS handshakes per request
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+        # Identical questions recur across quizzes; cache LLM responses so
+        # repeats skip the multi-second (and billed) model round-trip
+        self.redis = aioredis.Redis.from_url(settings.REDIS_URL)
+        # Bound batch concurrency so bulk generation saturates neither the
+        # API rate limit nor the local connection pool
+        self._sem = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+    async def aclose(self):
+        """Close the underlying HTTP client (call on application shutdown)"""
+        await self.client.aclose()
+        await self.redis.aclose()
+
+    def _cache_key(self, prompt: str) -> str:
+        return "ai:" + hashlib.sha256(f"{self.model}:{prompt}".encode()).hexdigest()
+
+    async def _cache_get(self, key: str):
+        try:
+            cached = await self.redis.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"AI cache read failed: {str(e)}")
+        return None
+
+    async def _cache_set(self, key: str, value) -> None:
+        try:
+            await self.redis.setex(key, AI_CACHE_TTL, orjson.dumps(value))
+        except Exception as e:
+            logger.warning(f"AI cache write failed: {str(e)}")
     
     async def generate_answer(self, question: str, options: List[str] = None) -> AIAnswer:
         """Generate AI answer for a given question"""
         try:
             # Prepare the prompt
             if options:
-                options_text = "\n".join([f"{chr(65+i)}. {opt}" for i, opt in enumerate(options)])
-                prompt = f"""
-                Question: {question}
-                
-                Options:
-                {options_text}
-                
-                Please provide:
-                1. The correct answer (A, B, C, or D)
-                2. A detailed explanation of why this answer is correct
-                3. Your confidence level (0.0 to 1.0)
-                4. Step-by-step reasoning
-                
-                Format your response as JSON:
-                {{
-                    "answer": "A",
-                    "explanation": "Detailed explanation here...",
-                    "confidence_score": 0.95,
-                    "reasoning": "Step by step reasoning..."
-                }}
-                """
+                prompt = _MCQ_PROMPT.substitute(
+                    question=question,
+                    options_text=_format_options(options)
+                )
             else:
-                prompt = f"""
-                Question: {question}
-                
-                Please provide:
-                1. A comprehensive answer to this question
-                2. A detailed explanation
-                3. Your confidence level (0.0 to 1.0)
-                4. Step-by-step reasoning
-                
-                Format your response as JSON:
-                {{
-                    "answer": "Your answer here...",
-                    "explanation": "Detailed explanation here...",
-                    "confidence_score": 0.95,
-                    "reasoning": "Step by step reasoning..."
-                }}
-                """
-            
+                prompt = _OPEN_PROMPT.substitute(question=question)
+
+            cache_key = self._cache_key(prompt)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return AIAnswer(**cached)
+
             # Make API call to OpenRouter
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json={
-                        "model": "anthropic/claude-3.5-sonnet",  # Using Claude for better reasoning
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are an expert interview preparation assistant. Provide accurate, well-reasoned answers to interview questions with detailed explanations."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 1000
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    
-                    # Parse JSON response
-                    try:
-                        ai_response = json.loads(content)
-                        return AIAnswer(
-                            answer=ai_response.get("answer", ""),
-                            explanation=ai_response.get("explanation", ""),
-                            confidence_score=float(ai_response.get("confidence_score", 0.5)),
-                            reasoning=ai_response.get("reasoning", "")
-                        )
-                    except json.JSONDecodeError:
-                        # Fallback if JSON parsing fails
-                        return AIAnswer(
-                            answer=content[:200],
-                            explanation=content,
-                            confidence_score=0.5,
-                            reasoning="AI response parsing failed"
-                        )
-                else:
-                    logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
-                    return self._fallback_answer(question, options)
+            response = await self.client.post(
+                "/chat/completions",
+                content=orjson.dumps({
+                    "model": self.model,
+                    "messages": [
+                        _GENERATE_SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.3,
+                    "max_tokens": 1000
+                })
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                content = result["choices"][0]["message"]["content"]
+
+                # Parse JSON response
+                try:
+                    ai_response = _extract_json(content)
+                    answer = AIAnswer(
+                        answer=ai_response.get("answer", ""),
+                        explanation=ai_response.get("explanation", ""),
+                        confidence_score=float(ai_response.get("confidence_score", 0.5)),
+                        reasoning=ai_response.get("reasoning", "")
+                    )
+                    await self._cache_set(cache_key, asdict(answer))
+                    return answer
+                except orjson.JSONDecodeError:
+                    # Fallback if JSON parsing fails
+                    return AIAnswer(
+                        answer=content[:200],
+                        explanation=content,
+                        confidence_score=0.5,
+                        reasoning="AI response parsing failed"
+                    )
+            else:
+                logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
+                return self._fallback_answer(question, options)
         
         except Exception as e:
             logger.error(f"Error generating AI answer: {str(e)}")
             return self._fallback_answer(question, options)
     
+    async def generate_answers_batch(self, questions: List[Tuple[str, Optional[List[str]]]]) -> List[AIAnswer]:
+        """Generate answers for many questions concurrently.
+
+        Each item is a (question, options) pair. Calls run in parallel under
+        a bounded semaphore, so a batch completes in roughly the latency of
+        one call instead of the sum of all of them.
+        """
+        async def _bounded(question: str, options: Optional[List[str]]) -> AIAnswer:
+            async with self._sem:
+                return await self.generate_answer(question, options)
+
+        return await asyncio.gather(*(_bounded(q, opts) for q, opts in questions))
+
     async def validate_answer(self, question: str, scraped_answer: str, options: List[str] = None) -> Tuple[bool, float, str]:
         """Validate a scraped answer using AI"""
         try:
             if options:
-                options_text = "\n".join([f"{chr(65+i)}. {opt}" for i, opt in enumerate(options)])
-                prompt = f"""
-                Question: {question}
-                
-                Options:
-                {options_text}
-                
-                Scraped Answer: {scraped_answer}
-                
-                Please validate if the scraped answer is correct. Provide:
-                1. Is the answer correct? (true/false)
-                2. Confidence score (0.0 to 1.0)
-                3. Explanation of your validation
-                
-                Format as JSON:
-                {{
-                    "is_correct": true,
-                    "confidence_score": 0.95,
-                    "explanation": "Validation explanation..."
-                }}
-                """
+                prompt = _VALIDATE_MCQ_PROMPT.substitute(
+                    question=question,
+                    options_text=_format_options(options),
+                    scraped_answer=scraped_answer
+                )
             else:
-                prompt = f"""
-                Question: {question}
-                Scraped Answer: {scraped_answer}
-                
-                Please validate if this answer is reasonable and correct. Provide:
-                1. Is the answer correct? (true/false)
-                2. Confidence score (0.0 to 1.0)
-                3. Explanation of your validation
-                
-                Format as JSON:
-                {{
-                    "is_correct": true,
-                    "confidence_score": 0.95,
-                    "explanation": "Validation explanation..."
-                }}
-                """
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json={
-                        "model": "anthropic/claude-3.5-sonnet",
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are an expert validator for interview questions and answers. Carefully analyze the correctness of provided answers."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.1,
-                        "max_tokens": 500
-                    },
-                    timeout=30.0
+                prompt = _VALIDATE_OPEN_PROMPT.substitute(
+                    question=question,
+                    scraped_answer=scraped_answer
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    
-                    try:
-                        validation = json.loads(content)
-                        return (
-                            validation.get("is_correct", False),
-                            float(validation.get("confidence_score", 0.5)),
-                            validation.get("explanation", "")
-                        )
-                    except json.JSONDecodeError:
-                        return False, 0.5, "Validation parsing failed"
-                else:
-                    return False, 0.5, f"API error: {response.status_code}"
+
+            cache_key = self._cache_key(prompt)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return (
+                    cached["is_correct"],
+                    cached["confidence_score"],
+                    cached["explanation"]
+                )
+
+            response = await self.client.post(
+                "/chat/completions",
+                content=orjson.dumps({
+                    "model": self.model,
+                    "messages": [
+                        _VALIDATE_SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.1,
+                    "max_tokens": 500
+                })
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                content = result["choices"][0]["message"]["content"]
+
+                try:
+                    validation = _extract_json(content)
+                    is_correct = validation.get("is_correct", False)
+                    confidence = float(validation.get("confidence_score", 0.5))
+                    explanation = validation.get("explanation", "")
+                    await self._cache_set(cache_key, {
+                        "is_correct": is_correct,
+                        "confidence_score": confidence,
+                        "explanation": explanation
+                    })
+                    return is_correct, confidence, explanation
+                except orjson.JSONDecodeError:
+                    return False, 0.5, "Validation parsing failed"
+            else:
+                return False, 0.5, f"API error: {response.status_code}"
         
         except Exception as e:
             logger.error(f"Error validating answer: {str(e)}")
@@ -211,47 +335,36 @@ class AIService:
     async def improve_question(self, question: str, context: str = None) -> str:
         """Improve question quality and clarity"""
         try:
-            prompt = f"""
-            Original Question: {question}
-            Context: {context or "General interview question"}
-            
-            Please improve this question to make it:
-            1. More clear and specific
-            2. Grammatically correct
-            3. Professional and interview-appropriate
-            4. Maintain the original intent
-            
-            Return only the improved question text.
-            """
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json={
-                        "model": "anthropic/claude-3.5-sonnet",
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "You are an expert at improving interview questions for clarity and professionalism."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 300
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    improved_question = result["choices"][0]["message"]["content"].strip()
-                    return improved_question
-                else:
-                    return question  # Return original if improvement fails
+            prompt = _IMPROVE_PROMPT.substitute(
+                question=question,
+                context=context or "General interview question"
+            )
+
+            cache_key = self._cache_key(prompt)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            response = await self.client.post(
+                "/chat/completions",
+                content=orjson.dumps({
+                    "model": self.model,
+                    "messages": [
+                        _IMPROVE_SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.3,
+                    "max_tokens": 300
+                })
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                improved_question = result["choices"][0]["message"]["content"].strip()
+                await self._cache_set(cache_key, improved_question)
+                return improved_question
+            else:
+                return question  # Return original if improvement fails
         
         except Exception as e:
             logger.error(f"Error improving question: {str(e)}")
@@ -272,4 +385,6 @@ class AIService:
                 explanation="AI service temporarily unavailable. Consult relevant documentation or experts.",
                 confidence_score=0.0,
                 reasoning="Fallback response due to service unavailability"
-            )
\ No newline at end of file
+            )
+# Global AI service instance (shares one HTTP connection pool app-wide)
+ai_service = AIService()
@@ -1,48 +1,177 @@
+import asyncio
+import heapq
 import firebase_admin
-from firebase_admin import credentials, messaging
+import httpx
+from firebase_admin import credentials
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from google.oauth2 import service_account
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from sqlalchemy import select, insert, update, case, and_, tuple_
+from datetime import datetime, timedelta, date, time, timezone
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import logging
-import json
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.models.user import User
 from app.models.notification import Notification, NotificationSchedule
 from app.models.quiz import DailyQuizSchedule
 
 logger = logging.getLogger(__name__)
 
+_FCM_SCOPES = ["https://www.googleapis.com/auth/firebase.messaging"]
+
+# Schedule inserts queue up and flush as one executemany once either
+# bound is hit, so a signup burst costs one commit per batch instead of
+# one commit/fsync per registration
+_SCHEDULE_FLUSH_ROWS = 64
+_SCHEDULE_FLUSH_SECONDS = 0.25
+
+@lru_cache(maxsize=1)
+def _firebase_config() -> Dict:
+    """Build the service-account dict from settings once per process"""
+    return {
+        "type": "service_account",
+        "project_id": settings.FIREBASE_PROJECT_ID,
+        "private_key_id": settings.FIREBASE_PRIVATE_KEY_ID,
+        "private_key": settings.FIREBASE_PRIVATE_KEY.replace('\\n', '\n'),
+        "client_email": settings.FIREBASE_CLIENT_EMAIL,
+        "client_id": settings.FIREBASE_CLIENT_ID,
+        "auth_uri": settings.FIREBASE_AUTH_URI,
+        "token_uri": settings.FIREBASE_TOKEN_URI,
+    }
+
 class NotificationService:
+    # Firebase app and FCM credential are process-wide: every instance
+    # shares them, so re-instantiating the service never re-parses the
+    # certificate or re-reads the environment
+    firebase_app = None
+    _creds = None
+    _firebase_init_done = False
+
     def __init__(self):
-        self.firebase_app = None
+        # Bearer token for FCM REST calls, cached until shortly before
+        # expiry so each send skips the JWT-sign/token round-trip
+        self._token: Optional[str] = None
+        self._token_exp = datetime.min
+        self._token_lock = asyncio.Lock()
         self._initialize_firebase()
-    
-    def _initialize_firebase(self):
-        """Initialize Firebase Admin SDK"""
+        # One HTTP/2 connection to FCM multiplexes up to ~100 concurrent
+        # sends, so a batch costs one round-trip burst instead of N
+        self._http: Optional[httpx.AsyncClient] = None
+        self._send_sem = asyncio.Semaphore(100)
+        # Min-heap of (next_send, schedule_id) so each tick only touches
+        # schedules that are actually due; None means "reload from the DB"
+        self._due_heap: Optional[List[Tuple[datetime, int]]] = None
+        # Queued schedule rows awaiting the next batched insert
+        self._pending_schedule_inserts: List[Dict] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def _initialize_firebase(cls):
+        """Initialize Firebase Admin SDK (once per process)"""
+        if cls._firebase_init_done:
+            return
+
         try:
+            firebase_config = _firebase_config()
+
             if not firebase_admin._apps:
-                # Create credentials from environment variables
-                firebase_config = {
-                    "type": "service_account",
-                    "project_id": settings.FIREBASE_PROJECT_ID,
-                    "private_key_id": settings.FIREBASE_PRIVATE_KEY_ID,
-                    "private_key": settings.FIREBASE_PRIVATE_KEY.replace('\\n', '\n'),
-                    "client_email": settings.FIREBASE_CLIENT_EMAIL,
-                    "client_id": settings.FIREBASE_CLIENT_ID,
-                    "auth_uri": settings.FIREBASE_AUTH_URI,
-                    "token_uri": settings.FIREBASE_TOKEN_URI,
-                }
-                
                 cred = credentials.Certificate(firebase_config)
-                self.firebase_app = firebase_admin.initialize_app(cred)
+                cls.firebase_app = firebase_admin.initialize_app(cred)
             else:
-                self.firebase_app = firebase_admin.get_app()
-                
+                cls.firebase_app = firebase_admin.get_app()
+
+            # Dedicated google-auth credential for the FCM REST endpoint
+            cls._creds = service_account.Credentials.from_service_account_info(
+                firebase_config, scopes=_FCM_SCOPES
+            )
+
         except Exception as e:
             logger.error(f"Failed to initialize Firebase: {str(e)}")
-            self.firebase_app = None
+            cls.firebase_app = None
+            cls._creds = None
+
+        cls._firebase_init_done = True
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url="https://fcm.googleapis.com",
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)
+            )
+        return self._http
+
+    async def aclose(self):
+        """Flush queued writes and close the FCM HTTP client (on shutdown)"""
+        await self.flush_schedule_inserts()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _fcm_auth_header(self) -> Dict[str, str]:
+        """Return a cached bearer token, refreshing shortly before expiry"""
+        if self._creds is None:
+            raise RuntimeError("Firebase credentials not configured")
+        
+        now = datetime.utcnow()
+        if self._token is None or now >= self._token_exp:
+            async with self._token_lock:
+                if self._token is None or now >= self._token_exp:
+                    await asyncio.to_thread(self._creds.refresh, GoogleAuthRequest())
+                    self._token = self._creds.token
+                    # Refresh a minute early so in-flight batches never
+                    # race token expiry
+                    self._token_exp = self._creds.expiry - timedelta(seconds=60)
+        
+        return {"Authorization": f"Bearer {self._token}"}
+
+    def _build_fcm_payload(self, fcm_token: str, title: str, message: str, data: Dict = None) -> Dict:
+        """Build an FCM v1 REST message payload"""
+        return {
+            "message": {
+                "token": fcm_token,
+                "notification": {
+                    "title": title,
+                    "body": message
+                },
+                "data": {key: str(value) for key, value in (data or {}).items()},
+                "android": {
+                    "notification": {
+                        "icon": "ic_notification",
+                        "color": "#FF6B35"
+                    }
+                },
+                "apns": {
+                    "payload": {
+                        "aps": {
+                            "badge": 1,
+                            "sound": "default"
+                        }
+                    }
+                }
+            }
+        }
+
+    async def _post_fcm(self, payload: Dict, headers: Dict[str, str]) -> Optional[str]:
+        """POST one message to FCM; returns the message name or None on failure"""
+        try:
+            async with self._send_sem:
+                response = await self._get_http().post(
+                    f"/v1/projects/{settings.FIREBASE_PROJECT_ID}/messages:send",
+                    json=payload,
+                    headers=headers
+                )
+            if response.status_code == 200:
+                return response.json().get("name")
+            logger.error(f"FCM send failed: {response.status_code} - {response.text}")
+        except Exception as e:
+            logger.error(f"Failed to send FCM message: {str(e)}")
+        return None
     
     async def send_notification(
         self,
@@ -70,58 +199,124 @@ class NotificationService:
                 data=data
             )
             
+            # No refresh after commit: expire_on_commit=False keeps the
+            # instance usable and the fields read below are all set locally
             if db:
                 db.add(notification)
                 await db.commit()
-                await db.refresh(notification)
             
             # Send FCM notification if token is provided
             if fcm_token:
-                fcm_message = messaging.Message(
-                    notification=messaging.Notification(
-                        title=title,
-                        body=message
-                    ),
-                    data=data or {},
-                    token=fcm_token,
-                    android=messaging.AndroidConfig(
-                        notification=messaging.AndroidNotification(
-                            icon="ic_notification",
-                            color="#FF6B35"
-                        )
-                    ),
-                    apns=messaging.APNSConfig(
-                        payload=messaging.APNSPayload(
-                            aps=messaging.Aps(
-                                badge=1,
-                                sound="default"
-                            )
-                        )
-                    )
-                )
+                headers = await self._fcm_auth_header()
+                payload = self._build_fcm_payload(fcm_token, title, message, data)
+                message_id = await self._post_fcm(payload, headers)
                 
-                try:
-                    response = messaging.send(fcm_message)
-                    logger.info(f"Successfully sent message: {response}")
-                    
-                    # Update notification record
-                    if db:
-                        notification.is_sent = True
-                        notification.sent_at = datetime.utcnow()
-                        notification.fcm_message_id = response
-                        await db.commit()
-                    
-                    return True
-                    
-                except Exception as e:
-                    logger.error(f"Failed to send FCM message: {str(e)}")
+                if message_id is None:
                     return False
+                
+                logger.info(f"Successfully sent message: {message_id}")
+                
+                # Update notification record
+                if db:
+                    notification.is_sent = True
+                    notification.sent_at = datetime.utcnow()
+                    notification.fcm_message_id = message_id
+                    await db.commit()
             
             return True
             
         except Exception as e:
             logger.error(f"Error sending notification: {str(e)}")
             return False
+
+    async def send_many(
+        self,
+        pending: List[Dict],
+        db: AsyncSession = None,
+        commit: bool = True
+    ) -> List[bool]:
+        """Send a batch of quiz reminders in one multiplexed HTTP/2 burst.
+
+        Notification rows are written first, the FCM posts then run
+        concurrently over the shared connection, and delivery state is
+        flushed back afterwards. With commit=False the writes only flush,
+        leaving the caller's transaction (and any claimed row locks) open.
+        """
+        if not pending:
+            return []
+        
+        if not self.firebase_app:
+            logger.error("Firebase not initialized")
+            return [False] * len(pending)
+        
+        try:
+            headers = await self._fcm_auth_header()
+        except Exception as e:
+            logger.error(f"Failed to obtain FCM credentials: {str(e)}")
+            return [False] * len(pending)
+        
+        notifications = []
+        for item in pending:
+            notifications.append(Notification(
+                user_id=item["user_id"],
+                title=item["title"],
+                message=item["message"],
+                notification_type="quiz_reminder",
+                fcm_token=item.get("fcm_token"),
+                data={
+                    "type": "quiz_reminder",
+                    "action": "open_quiz",
+                    "user_id": str(item["user_id"])
+                }
+            ))
+        
+        if db:
+            db.add_all(notifications)
+            if commit:
+                await db.commit()
+            else:
+                await db.flush()
+
+        # One timestamp for the whole batch instead of a utcnow() per send
+        sent_at = datetime.utcnow()
+
+        async def _send(notification: Notification) -> bool:
+            if not notification.fcm_token:
+                return True  # No device token; the in-app record is enough
+            payload = self._build_fcm_payload(
+                notification.fcm_token,
+                notification.title,
+                notification.message,
+                notification.data
+            )
+            message_id = await self._post_fcm(payload, headers)
+            if message_id is None:
+                return False
+            notification.is_sent = True
+            notification.sent_at = sent_at
+            notification.fcm_message_id = message_id
+            return True
+        
+        # return_exceptions so one raising send cannot abort the whole batch;
+        # anything unexpected is logged and reported as a failed delivery
+        results = await asyncio.gather(
+            *(_send(n) for n in notifications), return_exceptions=True
+        )
+
+        normalized = []
+        for notification, result in zip(notifications, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error sending notification to user {notification.user_id}: {str(result)}"
+                )
+                normalized.append(False)
+            else:
+                normalized.append(result)
+
+        if db and commit:
+            await db.commit()
+
+        return normalized
     
     async def send_quiz_reminder(
         self,
@@ -176,127 +371,273 @@ class NotificationService:
             db=db
         )
     
-    async def setup_daily_notifications(self, user_id: int, db: AsyncSession):
-        """Set up daily notification schedule for a user"""
+    async def setup_daily_notifications(self, user_id: int, db: AsyncSession = None):
+        """Queue the default daily notification schedule for a user.
+
+        Rows are batched and written by flush_schedule_inserts once
+        _SCHEDULE_FLUSH_ROWS accumulate or _SCHEDULE_FLUSH_SECONDS elapse,
+        so signup bursts don't pay a commit per registration. The `db`
+        argument is unused (the flush runs on its own session) and kept
+        for caller compatibility.
+        """
         try:
-            # Create notification schedule
-            schedule = NotificationSchedule(
-                user_id=user_id,
-                notification_type="quiz_reminder",
-                scheduled_time=datetime.now().replace(
-                    hour=int(settings.DEFAULT_NOTIFICATION_TIME.split(':')[0]),
-                    minute=int(settings.DEFAULT_NOTIFICATION_TIME.split(':')[1]),
-                    second=0,
-                    microsecond=0
+            self._pending_schedule_inserts.append({
+                "user_id": user_id,
+                "notification_type": "quiz_reminder",
+                "scheduled_time": datetime.combine(
+                    date.today(),
+                    time(
+                        settings.DEFAULT_NOTIFICATION_HOUR,
+                        settings.DEFAULT_NOTIFICATION_MINUTE
+                    )
                 ),
-                frequency="daily",
-                title_template="📚 Daily Quiz Reminder",
-                message_template="Time to complete your daily quiz! Stay consistent with your learning goals."
-            )
-            
-            db.add(schedule)
-            await db.commit()
-            
+                "frequency": "daily",
+                "title_template": "📚 Daily Quiz Reminder",
+                "message_template": "Time to complete your daily quiz! Stay consistent with your learning goals."
+            })
+
+            if len(self._pending_schedule_inserts) >= _SCHEDULE_FLUSH_ROWS:
+                await self.flush_schedule_inserts()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._delayed_flush())
+
         except Exception as e:
             logger.error(f"Error setting up daily notifications: {str(e)}")
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(_SCHEDULE_FLUSH_SECONDS)
+        await self.flush_schedule_inserts()
+
+    async def flush_schedule_inserts(self):
+        """Write all queued notification schedules in one batched insert"""
+        async with self._flush_lock:
+            if not self._pending_schedule_inserts:
+                return
+
+            rows = self._pending_schedule_inserts
+            self._pending_schedule_inserts = []
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(NotificationSchedule), rows)
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"Error flushing notification schedules: {str(e)}")
     
-    async def get_pending_notifications(self, db: AsyncSession) -> List[Dict]:
-        """Get all pending notifications that need to be sent"""
+    async def get_pending_notifications(
+        self,
+        db: AsyncSession,
+        schedule_ids: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """Get all pending notifications that need to be sent.
+
+        When `schedule_ids` is given, only those schedules are considered
+        (the processor passes the ids its due-heap popped for this tick).
+        """
         try:
-            now = datetime.utcnow()
-            
-            # Get active notification schedules that are due
-            result = await db.execute(
-                select(NotificationSchedule, User)
+            # Aware UTC: next_send is timestamptz, so asyncpg hands back
+            # tz-aware datetimes and naive values don't compare against them
+            now = datetime.now(timezone.utc)
+            today = datetime.now().date()
+
+            # Single round-trip: anti-join against today's completed quizzes
+            # instead of issuing one completion check per due schedule.
+            # Project just the columns the send path needs rather than
+            # hydrating full schedule/user ORM objects.
+            stmt = (
+                select(
+                    NotificationSchedule.id,
+                    NotificationSchedule.frequency,
+                    NotificationSchedule.scheduled_time,
+                    NotificationSchedule.next_send,
+                    NotificationSchedule.title_template,
+                    NotificationSchedule.message_template,
+                    User.id.label("user_id"),
+                    User.fcm_token
+                )
                 .join(User, NotificationSchedule.user_id == User.id)
+                .outerjoin(
+                    DailyQuizSchedule,
+                    and_(
+                        DailyQuizSchedule.user_id == User.id,
+                        DailyQuizSchedule.scheduled_date >= today,
+                        DailyQuizSchedule.is_completed == True
+                    )
+                )
                 .where(
                     and_(
                         NotificationSchedule.is_active == True,
                         NotificationSchedule.next_send <= now,
                         User.notification_enabled == True,
-                        User.is_active == True
+                        User.is_active == True,
+                        DailyQuizSchedule.id.is_(None)  # No completed quiz today
                     )
                 )
             )
-            
+
+            if schedule_ids is not None:
+                stmt = stmt.where(NotificationSchedule.id.in_(schedule_ids))
+
+            # Claim the batch: each worker locks a disjoint set of schedule
+            # rows, so HA deployments never double-send. The lock is held
+            # until the caller commits, and the LIMIT bounds per-tick work.
+            stmt = (
+                stmt
+                .with_for_update(skip_locked=True, of=NotificationSchedule)
+                .limit(500)
+            )
+
+            result = await db.execute(stmt)
+
             pending = []
-            for schedule, user in result.all():
-                # Check if user has completed today's quiz
-                today = datetime.now().date()
-                quiz_result = await db.execute(
-                    select(DailyQuizSchedule)
-                    .where(
-                        and_(
-                            DailyQuizSchedule.user_id == user.id,
-                            DailyQuizSchedule.scheduled_date >= today,
-                            DailyQuizSchedule.is_completed == True
-                        )
-                    )
-                )
-                
-                completed_today = quiz_result.scalar_one_or_none()
-                
-                # Only send notification if quiz not completed
-                if not completed_today:
-                    pending.append({
-                        "schedule": schedule,
-                        "user": user,
-                        "title": schedule.title_template,
-                        "message": schedule.message_template
-                    })
-            
+            for row in result.all():
+                pending.append({
+                    "schedule_id": row.id,
+                    "frequency": row.frequency,
+                    "scheduled_time": row.scheduled_time,
+                    "next_send": row.next_send,
+                    "user_id": row.user_id,
+                    "fcm_token": row.fcm_token,
+                    "title": row.title_template,
+                    "message": row.message_template
+                })
+
             return pending
             
         except Exception as e:
             logger.error(f"Error getting pending notifications: {str(e)}")
             return []
     
+    def invalidate_schedule_cache(self):
+        """Drop the cached due-heap; the next tick reloads it from the DB.
+
+        Wired to the scheduler's LISTEN/NOTIFY callback so schedule
+        inserts/updates from other processes are picked up.
+        """
+        self._due_heap = None
+
+    async def _load_due_heap(self, db: AsyncSession):
+        """Load every active schedule's (next_send, id) into the heap"""
+        result = await db.execute(
+            select(NotificationSchedule.id, NotificationSchedule.next_send)
+            .where(
+                and_(
+                    NotificationSchedule.is_active == True,
+                    NotificationSchedule.next_send.is_not(None)
+                )
+            )
+        )
+        heap = [(next_send, schedule_id) for schedule_id, next_send in result.all()]
+        heapq.heapify(heap)
+        self._due_heap = heap
+
+    @staticmethod
+    def _next_send_after(item: Dict) -> datetime:
+        """Python mirror of the SQL CASE that advances next_send"""
+        if item["frequency"] == "daily":
+            return item["scheduled_time"] + timedelta(days=1)
+        if item["frequency"] == "weekly":
+            return item["scheduled_time"] + timedelta(weeks=1)
+        if item["frequency"] == "monthly":
+            return item["scheduled_time"] + timedelta(days=30)
+        return item["next_send"]
+
     async def process_pending_notifications(self, db: AsyncSession):
         """Process all pending notifications"""
         try:
-            pending = await self.get_pending_notifications(db)
-            
-            for notification_data in pending:
-                schedule = notification_data["schedule"]
-                user = notification_data["user"]
-                
-                # Send notification (FCM token would be stored in user profile)
-                success = await self.send_quiz_reminder(
-                    user=user,
-                    fcm_token=None,  # Would get from user profile
-                    db=db
-                )
-                
-                if success:
-                    # Update schedule
-                    schedule.last_sent = datetime.utcnow()
-                    
-                    # Calculate next send time based on frequency
-                    if schedule.frequency == "daily":
-                        schedule.next_send = schedule.scheduled_time + timedelta(days=1)
-                    elif schedule.frequency == "weekly":
-                        schedule.next_send = schedule.scheduled_time + timedelta(weeks=1)
-                    elif schedule.frequency == "monthly":
-                        schedule.next_send = schedule.scheduled_time + timedelta(days=30)
-                    
-                    await db.commit()
-                    
+            # Aware UTC so the comparison below works against the tz-aware
+            # next_send values the heap holds (timestamptz column)
+            now = datetime.now(timezone.utc)
+
+            if self._due_heap is None:
+                await self._load_due_heap(db)
+
+            # Pop only what is due; the join below then fetches just those
+            # rows instead of rescanning every active schedule each tick
+            due = []
+            while self._due_heap and self._due_heap[0][0] <= now:
+                due.append(heapq.heappop(self._due_heap))
+
+            if not due:
+                return
+
+            due_ids = [schedule_id for _, schedule_id in due]
+            pending = await self.get_pending_notifications(db, schedule_ids=due_ids)
+
+            advanced = {}
+            if pending:
+                # One batched send instead of a sequential per-user loop.
+                # commit=False keeps the claim transaction (and the
+                # SKIP LOCKED row locks) open until everything lands
+                results = await self.send_many(pending, db, commit=False)
+
+                success_ids = []
+                for notification_data, success in zip(pending, results):
+                    if not success:
+                        continue
+                    schedule_id = notification_data["schedule_id"]
+                    success_ids.append(schedule_id)
+                    advanced[schedule_id] = self._next_send_after(notification_data)
+
+                if success_ids:
+                    # One UPDATE advances every sent schedule, with
+                    # next_send computed server-side per frequency instead
+                    # of per-row Python date math
+                    await db.execute(
+                        update(NotificationSchedule)
+                        .where(NotificationSchedule.id.in_(success_ids))
+                        .values(
+                            last_sent=now,
+                            next_send=case(
+                                (
+                                    NotificationSchedule.frequency == "daily",
+                                    NotificationSchedule.scheduled_time + timedelta(days=1)
+                                ),
+                                (
+                                    NotificationSchedule.frequency == "weekly",
+                                    NotificationSchedule.scheduled_time + timedelta(weeks=1)
+                                ),
+                                (
+                                    NotificationSchedule.frequency == "monthly",
+                                    NotificationSchedule.scheduled_time + timedelta(days=30)
+                                ),
+                                else_=NotificationSchedule.next_send
+                            )
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+
+                # One commit closes the claim transaction: notification
+                # rows, delivery state and schedule advancement together
+                await db.commit()
+
+            if self._due_heap is not None:
+                # Push everything popped back: sent schedules at their new
+                # next_send, everything else unchanged so it retries next tick
+                for next_send, schedule_id in due:
+                    heapq.heappush(
+                        self._due_heap,
+                        (advanced.get(schedule_id, next_send), schedule_id)
+                    )
+
         except Exception as e:
+            # Rebuild the heap next tick; it may be out of sync with the DB
+            self._due_heap = None
             logger.error(f"Error processing pending notifications: {str(e)}")
     
     async def mark_notification_read(self, notification_id: int, db: AsyncSession):
         """Mark a notification as read"""
         try:
-            result = await db.execute(
-                select(Notification).where(Notification.id == notification_id)
+            # Single UPDATE instead of SELECT + mutate + commit: one
+            # round-trip, and a missing id is simply a no-op as before
+            await db.execute(
+                update(Notification)
+                .where(Notification.id == notification_id)
+                .values(is_read=True, read_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
             )
-            notification = result.scalar_one_or_none()
-            
-            if notification:
-                notification.is_read = True
-                notification.read_at = datetime.utcnow()
-                await db.commit()
-                
+            await db.commit()
+
         except Exception as e:
             logger.error(f"Error marking notification as read: {str(e)}")
     
@@ -304,21 +645,38 @@ class NotificationService:
         self,
         user_id: int,
         limit: int = 20,
-        offset: int = 0,
+        after: Optional[Tuple[datetime, int]] = None,
         db: AsyncSession = None
-    ) -> List[Notification]:
-        """Get notifications for a user"""
+    ) -> Tuple[List[Notification], Optional[Tuple[datetime, int]]]:
+        """Get a page of notifications for a user, keyset-paginated.
+
+        `after` is the (created_at, id) cursor returned with the previous
+        page. Seeking on the cursor costs the same at any depth, unlike
+        OFFSET which scans and discards every skipped row.
+        """
         try:
+            stmt = select(Notification).where(Notification.user_id == user_id)
+
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(Notification.created_at, Notification.id) < after
+                )
+
             result = await db.execute(
-                select(Notification)
-                .where(Notification.user_id == user_id)
-                .order_by(Notification.created_at.desc())
+                stmt
+                .order_by(Notification.created_at.desc(), Notification.id.desc())
                 .limit(limit)
-                .offset(offset)
             )
-            
-            return result.scalars().all()
-            
+
+            rows = result.scalars().all()
+            next_cursor = (
+                (rows[-1].created_at, rows[-1].id) if len(rows) == limit else None
+            )
+            return rows, next_cursor
+
         except Exception as e:
             logger.error(f"Error getting user notifications: {str(e)}")
-            return []
\ No newline at end of file
+            return [], None
+
+# Global notification service instance
+notification_service = NotificationService()
@@ -3,39 +3,92 @@ from datetime import datetime, timedelta
 from typing import List
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, exists, and_
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, engine
 from app.models.user import User
-from app.models.quiz import DailyQuizSchedule
+from app.models.quiz import DailyQuizSchedule, DailyQuizTopic
 from app.models.topic import UserTopic, Topic
-from app.services.notification import NotificationService
+from app.services.notification import notification_service
 from app.services.question_service import QuestionService
 
 logger = logging.getLogger(__name__)
 
+# Channel the notification processor listens on; a trigger on
+# notification_schedules fires it whenever a schedule is inserted or updated
+NOTIFICATION_CHANNEL = "notification_due"
+
+_NOTIFY_TRIGGER_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION notify_notification_due() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('notification_due', NEW.id::text);
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS notification_due_trigger ON notification_schedules",
+    """
+    CREATE TRIGGER notification_due_trigger
+        AFTER INSERT OR UPDATE ON notification_schedules
+        FOR EACH ROW EXECUTE FUNCTION notify_notification_due()
+    """,
+)
+
 class SchedulerService:
     def __init__(self):
-        self.notification_service = NotificationService()
+        self.notification_service = notification_service
         self.question_service = QuestionService()
         self.is_running = False
-    
+        self._notification_due = asyncio.Event()
+        self._listener_conn = None
+
     async def start(self):
         """Start the scheduler service"""
         if self.is_running:
             return
-        
+
         self.is_running = True
         logger.info("Starting scheduler service...")
-        
+
+        await self._setup_notification_listener()
+
         # Start background tasks
         asyncio.create_task(self._daily_quiz_scheduler())
         asyncio.create_task(self._notification_processor())
-    
+
     async def stop(self):
         """Stop the scheduler service"""
         self.is_running = False
+        if self._listener_conn is not None:
+            try:
+                self._listener_conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing listener connection: {str(e)}")
+            self._listener_conn = None
         logger.info("Stopping scheduler service...")
+
+    async def _setup_notification_listener(self):
+        """LISTEN on Postgres so the notification loop wakes on demand"""
+        try:
+            raw = await engine.raw_connection()
+            driver_conn = raw.driver_connection
+            for statement in _NOTIFY_TRIGGER_DDL:
+                await driver_conn.execute(statement)
+            await driver_conn.add_listener(
+                NOTIFICATION_CHANNEL, self._on_notification_due
+            )
+            self._listener_conn = raw
+            logger.info(f"Listening on Postgres channel '{NOTIFICATION_CHANNEL}'")
+        except Exception as e:
+            logger.warning(
+                f"LISTEN/NOTIFY unavailable, falling back to polling: {str(e)}"
+            )
+
+    def _on_notification_due(self, connection, pid, channel, payload):
+        # A schedule changed in the DB: the cached due-heap is stale
+        self.notification_service.invalidate_schedule_cache()
+        self._notification_due.set()
     
     async def _daily_quiz_scheduler(self):
         """Schedule daily quizzes for all active users"""
@@ -55,12 +108,25 @@ class SchedulerService:
         """Process pending notifications"""
         while self.is_running:
             try:
+                # Clear before processing so a NOTIFY that lands mid-run
+                # triggers an immediate follow-up pass instead of being lost
+                self._notification_due.clear()
+
                 async with AsyncSessionLocal() as db:
                     await self.notification_service.process_pending_notifications(db)
-                
-                # Run every 15 minutes
-                await asyncio.sleep(900)
-                
+
+                # Wake on NOTIFY; the timeout keeps the old 15-minute poll as
+                # a safety net when LISTEN/NOTIFY is unavailable
+                try:
+                    await asyncio.wait_for(self._notification_due.wait(), timeout=900)
+                except asyncio.TimeoutError:
+                    # Without a listener nothing invalidates the cached
+                    # due-heap, so schedules created after startup would
+                    # stay invisible; reload it on every poll tick instead
+                    # (one indexed query), restoring the baseline behavior
+                    if self._listener_conn is None:
+                        self.notification_service.invalidate_schedule_cache()
+
             except Exception as e:
                 logger.error(f"Error in notification processor: {str(e)}")
                 await asyncio.sleep(300)  # Wait 5 minutes on error
@@ -68,63 +134,81 @@ class SchedulerService:
     async def _create_daily_quiz_schedules(self, db: AsyncSession):
         """Create daily quiz schedules for users who don't have one for today"""
         try:
-            today = datetime.now().date()
+            # One timestamp for the whole tick: every schedule created in
+            # this pass shares a consistent "now"
+            now = datetime.now()
+            today = now.date()
             tomorrow = today + timedelta(days=1)
-            
-            # Get all active users
+
+            # One anti-join query for active users missing today's schedule,
+            # instead of an existence check per user
             result = await db.execute(
-                select(User).where(User.is_active == True)
-            )
-            users = result.scalars().all()
-            
-            for user in users:
-                # Check if user already has a quiz scheduled for today
-                existing_schedule = await db.execute(
-                    select(DailyQuizSchedule).where(
-                        and_(
-                            DailyQuizSchedule.user_id == user.id,
-                            DailyQuizSchedule.scheduled_date >= today,
-                            DailyQuizSchedule.scheduled_date < tomorrow
-                        )
+                select(User.id)
+                .outerjoin(
+                    DailyQuizSchedule,
+                    and_(
+                        DailyQuizSchedule.user_id == User.id,
+                        DailyQuizSchedule.scheduled_date >= today,
+                        DailyQuizSchedule.scheduled_date < tomorrow
                     )
                 )
-                
-                if existing_schedule.scalar_one_or_none():
-                    continue  # User already has a quiz for today
-                
-                # Get user's active topics
-                user_topics_result = await db.execute(
-                    select(UserTopic, Topic)
-                    .join(Topic, UserTopic.topic_id == Topic.id)
-                    .where(
-                        and_(
-                            UserTopic.user_id == user.id,
-                            UserTopic.is_active == True
-                        )
+                .where(
+                    and_(
+                        User.is_active == True,
+                        DailyQuizSchedule.id.is_(None)
                     )
-                    .order_by(UserTopic.priority.desc())
                 )
-                
-                user_topics = user_topics_result.all()
-                
-                if not user_topics:
-                    continue  # User has no active topics
-                
-                # Select topics for today's quiz (limit to top 5 by priority)
-                selected_topics = [ut.topic_id for ut, _ in user_topics[:5]]
-                
-                # Create daily quiz schedule
-                quiz_schedule = DailyQuizSchedule(
-                    user_id=user.id,
-                    scheduled_date=datetime.now(),
-                    topics=selected_topics,
-                    questions_per_topic=1
+            )
+            missing_ids = result.scalars().all()
+            
+            if not missing_ids:
+                return
+            
+            # One query for all missing users' active topics, grouped in Python
+            user_topics_result = await db.execute(
+                select(UserTopic.user_id, UserTopic.topic_id)
+                .where(
+                    and_(
+                        UserTopic.user_id.in_(missing_ids),
+                        UserTopic.is_active == True
+                    )
                 )
-                
-                db.add(quiz_schedule)
+                .order_by(UserTopic.user_id, UserTopic.priority.desc())
+            )
+            
+            topics_by_user = {}
+            for user_id, topic_id in user_topics_result.all():
+                selected = topics_by_user.setdefault(user_id, [])
+                if len(selected) < 5:  # Top 5 topics by priority
+                    selected.append(topic_id)
             
+            # Bulk insert via the executemany path: one multi-row statement
+            # instead of an INSERT per ORM object. RETURNING hands back the
+            # generated ids so the topic join rows can go in one statement too.
+            rows = [
+                {
+                    "user_id": user_id,
+                    "scheduled_date": now,
+                    "questions_per_topic": 1
+                }
+                for user_id in topics_by_user
+            ]
+            result = await db.execute(
+                insert(DailyQuizSchedule).returning(
+                    DailyQuizSchedule.id, DailyQuizSchedule.user_id
+                ),
+                rows
+            )
+
+            topic_rows = [
+                {"schedule_id": schedule_id, "topic_id": topic_id, "slot": slot}
+                for schedule_id, user_id in result.all()
+                for slot, topic_id in enumerate(topics_by_user[user_id])
+            ]
+            await db.execute(insert(DailyQuizTopic), topic_rows)
+
             await db.commit()
-            logger.info(f"Created daily quiz schedules for {len(users)} users")
+            logger.info(f"Created daily quiz schedules for {len(topics_by_user)} users")
             
         except Exception as e:
             logger.error(f"Error creating daily quiz schedules: {str(e)}")
@@ -133,19 +217,23 @@ class SchedulerService:
     async def create_user_quiz_schedule(self, user_id: int, db: AsyncSession):
         """Create a quiz schedule for a specific user"""
         try:
-            today = datetime.now().date()
-            
-            # Check if user already has a quiz for today
-            existing_schedule = await db.execute(
-                select(DailyQuizSchedule).where(
-                    and_(
-                        DailyQuizSchedule.user_id == user_id,
-                        DailyQuizSchedule.scheduled_date >= today
+            now = datetime.now()
+            today = now.date()
+
+            # SELECT EXISTS(...) stops at the first index hit instead of
+            # materializing and hydrating a full schedule row
+            has_schedule = await db.scalar(
+                select(
+                    exists().where(
+                        and_(
+                            DailyQuizSchedule.user_id == user_id,
+                            DailyQuizSchedule.scheduled_date >= today
+                        )
                     )
                 )
             )
-            
-            if existing_schedule.scalar_one_or_none():
+
+            if has_schedule:
                 return  # User already has a quiz for today
             
             # Get user's active topics
@@ -168,15 +256,21 @@ class SchedulerService:
             # Select topics for quiz
             selected_topics = [ut.topic_id for ut in user_topics[:5]]
             
-            # Create quiz schedule
+            # Create quiz schedule with its topic join rows
             quiz_schedule = DailyQuizSchedule(
                 user_id=user_id,
-                scheduled_date=datetime.now(),
-                topics=selected_topics,
+                scheduled_date=now,
                 questions_per_topic=1
             )
-            
+
             db.add(quiz_schedule)
+            await db.flush()  # Assign the schedule id for the join rows
+            db.add_all([
+                DailyQuizTopic(
+                    schedule_id=quiz_schedule.id, topic_id=topic_id, slot=slot
+                )
+                for slot, topic_id in enumerate(selected_topics)
+            ])
             await db.commit()
             
         except Exception as e:
@@ -1,7 +1,7 @@
 import asyncio
+import time
 import httpx
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 from urllib.parse import urljoin, urlparse
 import re
@@ -11,7 +11,44 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# RE2 matches in guaranteed linear time, so a pathological Reddit post
+# cannot send the lazy '.+?\?' patterns into catastrophic backtracking.
+# google-re2 is not flag-compatible with stdlib re (no IGNORECASE etc.),
+# so the patterns below carry inline (?im) flags, and the probe compile
+# degrades to the stdlib engine when re2 is missing or incompatible
+try:
+    import re2 as _re
+    _re.compile(r'(?im)probe')
+except Exception:
+    _re = re
+
+# One shared JSON loader for the module: orjson decodes bytes directly
+# in C; degrade to the stdlib decoder where it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Question patterns compiled once at import; the extractor runs once per
+# Reddit post, so per-call re.compile/cache lookups add up
+_Q_PATTERNS = [
+    _re.compile(pattern)
+    for pattern in (
+        r'(?im)Q\d*[:\.]?\s*(.+?\?)',
+        r'(?im)Question\s*\d*[:\.]?\s*(.+?\?)',
+        r'(?im)They asked[:\s]*(.+?\?)',
+        r'(?im)The interviewer asked[:\s]*(.+?\?)',
+        r'(?im)["\'](.+?\?)["\']',
+    )
+]
+
+# slots drops the per-instance __dict__ — scrape runs allocate hundreds
+# of these, so the ~half-size instances add up
+@dataclass(slots=True)
 class ScrapedQuestion:
     question_text: str
     options: Optional[List[str]] = None
@@ -22,94 +59,359 @@ class ScrapedQuestion:
     topic: Optional[str] = None
     difficulty: Optional[str] = None
 
+_SCRAPER_HEADERS = {
+    'User-Agent': settings.USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+}
+
+# Shared across scrape jobs so the connection pool (and its warm TLS
+# sessions) survives between runs instead of being torn down per job
+_shared_client: Optional[httpx.AsyncClient] = None
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Return the shared scraper HTTP client, creating it on first use"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            headers=_SCRAPER_HEADERS,
+            # Concurrent requests to the same host multiplex over one TLS
+            # connection instead of opening a socket each
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=settings.MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=settings.MAX_CONCURRENT_REQUESTS,
+                keepalive_expiry=30
+            )
+        )
+    return _shared_client
+
+async def close_http_client():
+    """Close the shared scraper client (call on shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+# Subtrees the extractors never query; dropping them up front shrinks
+# the tree every css() call has to walk
+_PRUNE_TAGS = ['script', 'style', 'head', 'noscript', 'svg']
+
+# Imported on first parse rather than at module load: selectolax pulls in
+# the Lexbor C extension, and most processes (API workers, the scheduler)
+# never parse a page
+_parser_cls = None
+
+def _get_parser_cls():
+    global _parser_cls
+    if _parser_cls is None:
+        from selectolax.lexbor import LexborHTMLParser
+        _parser_cls = LexborHTMLParser
+    return _parser_cls
+
+def _make_tree(html: str):
+    """Parse a page and prune subtrees irrelevant to extraction"""
+    tree = _get_parser_cls()(html)
+    tree.strip_tags(_PRUNE_TAGS)  # Implemented in C
+    return tree
+
+# Per-site selector strings, prebuilt in one place so a site markup
+# change is a one-line fix and the loops never rebuild literals
+_TCY_CONTAINER = 'div.question-container'
+_TCY_QUESTION = 'div.question-text'
+_TCY_OPTION = 'div.option'
+_TCY_ANSWER = 'div.correct-answer'
+
+_PI_CONTAINER = 'div.mcq-question'
+_PI_QUESTION = 'p.question'
+_PI_OPTION = 'li.option'
+_PI_ANSWER = 'div.answer'
+
+_IB_CONTAINER = 'div.bix-div-container'
+_IB_QUESTION = 'td.bix-td-qtxt'
+_IB_OPTION_TABLE = 'table.bix-tbl-options'
+_IB_ANSWER = 'div.bix-ans-description'
+
+def _parse_tcy(html: str, search_url: str, topic: str) -> List[ScrapedQuestion]:
+    """Extract TCYOnline questions from a fetched page (sync, CPU-bound)"""
+    questions = []
+    tree = _make_tree(html)
+
+    # Find question containers (adjust selectors based on actual site structure)
+    for container in tree.css(_TCY_CONTAINER):
+        try:
+            question_text = container.css_first(_TCY_QUESTION)
+            if question_text is None:
+                continue
+
+            options = [
+                opt.text(strip=True) for opt in container.css(_TCY_OPTION)
+            ]
+
+            correct_answer = None
+            correct_element = container.css_first(_TCY_ANSWER)
+            if correct_element is not None:
+                correct_answer = correct_element.text(strip=True)
+
+            questions.append(ScrapedQuestion(
+                question_text=question_text.text(strip=True),
+                options=options if options else None,
+                correct_answer=correct_answer,
+                source_url=search_url,
+                source_name="TCYOnline",
+                topic=topic,
+                difficulty="medium"
+            ))
+
+        except Exception as e:
+            logger.error(f"Error parsing question from TCYOnline: {str(e)}")
+            continue
+
+    return questions
+
+def _parse_prepinsta(html: str, search_url: str, topic: str) -> List[ScrapedQuestion]:
+    """Extract PrepInsta questions from a fetched page (sync, CPU-bound)"""
+    questions = []
+    tree = _make_tree(html)
+
+    # Find question containers
+    for container in tree.css(_PI_CONTAINER):
+        try:
+            question_text = container.css_first(_PI_QUESTION)
+            if question_text is None:
+                continue
+
+            options = [
+                opt.text(strip=True) for opt in container.css(_PI_OPTION)
+            ]
+
+            # Look for answer explanation
+            answer_element = container.css_first(_PI_ANSWER)
+            correct_answer = None
+            if answer_element is not None:
+                correct_answer = answer_element.text(strip=True)
+
+            questions.append(ScrapedQuestion(
+                question_text=question_text.text(strip=True),
+                options=options if options else None,
+                correct_answer=correct_answer,
+                source_url=search_url,
+                source_name="PrepInsta",
+                topic=topic,
+                difficulty="medium"
+            ))
+
+        except Exception as e:
+            logger.error(f"Error parsing question from PrepInsta: {str(e)}")
+            continue
+
+    return questions
+
+def _parse_indiabix(html: str, search_url: str, topic: str) -> List[ScrapedQuestion]:
+    """Extract IndiaBIX questions from a fetched page (sync, CPU-bound)"""
+    questions = []
+    tree = _make_tree(html)
+
+    # Find question containers
+    for container in tree.css(_IB_CONTAINER):
+        try:
+            question_text = container.css_first(_IB_QUESTION)
+            if question_text is None:
+                continue
+
+            options = []
+            option_table = container.css_first(_IB_OPTION_TABLE)
+            if option_table is not None:
+                for opt in option_table.css('td'):
+                    option_text = opt.text(strip=True)
+                    if option_text and len(option_text) > 2:  # Filter out empty options
+                        options.append(option_text)
+
+            # Look for correct answer
+            answer_element = container.css_first(_IB_ANSWER)
+            correct_answer = None
+            if answer_element is not None:
+                answer_text = answer_element.text(strip=True)
+                # Extract answer from explanation
+                answer_match = re.search(r'Answer:\s*([A-D])', answer_text)
+                if answer_match:
+                    correct_answer = answer_match.group(1)
+
+            questions.append(ScrapedQuestion(
+                question_text=question_text.text(strip=True),
+                options=options if options else None,
+                correct_answer=correct_answer,
+                source_url=search_url,
+                source_name="IndiaBIX",
+                topic=topic,
+                difficulty="medium"
+            ))
+
+        except Exception as e:
+            logger.error(f"Error parsing question from IndiaBIX: {str(e)}")
+            continue
+
+    return questions
+
+# Successful fetches are memoized briefly so repeated scrapes of the
+# same topic (dashboard-style refreshes) skip network and rate limiting
+# entirely; expired or evicted entries simply refetch
+_PAGE_CACHE_TTL = 300
+_PAGE_CACHE_MAX = 512
+_page_cache: Dict[str, Tuple[float, str]] = {}
+
+# Decoded JSON payloads get the same treatment; kept separate from the
+# page cache so entries stay parsed and never mix with raw HTML
+_json_cache: Dict[str, Tuple[float, dict]] = {}
+_JSON_CACHE_MAX = 128
+
+# Byte budget per page: question markup sits well under this, so a
+# pathological or misbehaving page gets truncated instead of buffered whole
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+class TokenBucket:
+    """Token-bucket rate limiter: bursts up to capacity, then refills.
+
+    Unlike a fixed sleep per request, concurrent requests under the
+    steady-state rate pass straight through; only genuinely rate-limited
+    callers wait, and only for as long as the refill actually requires.
+    """
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # Tokens per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.refill_rate
+                )
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.refill_rate)
+
+# One bucket per host so TCYOnline/PrepInsta/IndiaBIX/Reddit are
+# rate-limited independently of each other
+_host_buckets: Dict[str, TokenBucket] = {}
+
+def _bucket_for(url: str) -> TokenBucket:
+    host = urlparse(url).netloc
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        bucket = TokenBucket(
+            capacity=settings.MAX_CONCURRENT_REQUESTS,
+            refill_rate=1.0 / settings.SCRAPING_DELAY
+        )
+        _host_buckets[host] = bucket
+    return bucket
+
 class WebScraper:
     def __init__(self):
         self.session = None
-        self.headers = {
-            'User-Agent': settings.USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-    
+
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(
-            headers=self.headers,
-            timeout=30.0,
-            limits=httpx.Limits(max_connections=settings.MAX_CONCURRENT_REQUESTS)
-        )
+        self.session = await get_http_client()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.aclose()
+        # The client is shared; it stays open for the next scrape job and
+        # is closed once, on application shutdown
+        pass
     
     async def scrape_page(self, url: str) -> Optional[str]:
         """Scrape a single page and return HTML content"""
         try:
-            await asyncio.sleep(settings.SCRAPING_DELAY)  # Rate limiting
+            cached = _page_cache.get(url)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            await _bucket_for(url).acquire()  # Per-host rate limiting
+
+            # Stream the body in chunks so peak memory is bounded by the
+            # byte budget, not by whatever the server decides to send
+            chunks = []
+            received = 0
+            async with self.session.stream("GET", url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received >= _MAX_PAGE_BYTES:
+                        logger.warning(f"Truncating oversized page {url} at {_MAX_PAGE_BYTES} bytes")
+                        break
+            text = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+            # Cache only successful responses; failures retry on next call
+            if len(_page_cache) >= _PAGE_CACHE_MAX:
+                oldest = min(_page_cache, key=lambda key: _page_cache[key][0])
+                del _page_cache[oldest]
+            _page_cache[url] = (time.monotonic() + _PAGE_CACHE_TTL, text)
+
+            return text
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            return None
+
+    async def scrape_json(self, url: str) -> Optional[dict]:
+        """Fetch a JSON endpoint and return the decoded payload.
+
+        Decodes straight from the response bytes, skipping the
+        intermediate .text str materialization scrape_page pays.
+        """
+        try:
+            cached = _json_cache.get(url)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            await _bucket_for(url).acquire()  # Per-host rate limiting
             response = await self.session.get(url)
             response.raise_for_status()
-            return response.text
+            data = _json_loads(response.content)
+
+            # Cache only successful responses; failures retry on next call
+            if len(_json_cache) >= _JSON_CACHE_MAX:
+                oldest = min(_json_cache, key=lambda key: _json_cache[key][0])
+                del _json_cache[oldest]
+            _json_cache[url] = (time.monotonic() + _PAGE_CACHE_TTL, data)
+
+            return data
+        except _JSONDecodeError:
+            logger.error(f"Invalid JSON payload from {url}")
+            return None
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            logger.error(f"Error fetching JSON from {url}: {str(e)}")
             return None
-    
+
     async def scrape_tcyonline(self, topic: str) -> List[ScrapedQuestion]:
         """Scrape questions from TCYOnline"""
-        questions = []
         try:
             # TCYOnline specific scraping logic
             search_url = f"https://www.tcyonline.com/search?q={topic}"
             html = await self.scrape_page(search_url)
             
             if not html:
-                return questions
-            
-            soup = BeautifulSoup(html, 'html.parser')
+                return []
             
-            # Find question containers (adjust selectors based on actual site structure)
-            question_containers = soup.find_all('div', class_='question-container')
-            
-            for container in question_containers:
-                try:
-                    question_text = container.find('div', class_='question-text')
-                    if not question_text:
-                        continue
-                    
-                    options = []
-                    option_elements = container.find_all('div', class_='option')
-                    for opt in option_elements:
-                        options.append(opt.get_text(strip=True))
-                    
-                    correct_answer = None
-                    correct_element = container.find('div', class_='correct-answer')
-                    if correct_element:
-                        correct_answer = correct_element.get_text(strip=True)
-                    
-                    questions.append(ScrapedQuestion(
-                        question_text=question_text.get_text(strip=True),
-                        options=options if options else None,
-                        correct_answer=correct_answer,
-                        source_url=search_url,
-                        source_name="TCYOnline",
-                        topic=topic,
-                        difficulty="medium"
-                    ))
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing question from TCYOnline: {str(e)}")
-                    continue
+            # Parse on a worker thread so other gathered scrape tasks keep
+            # running while this page's CPU-bound extraction executes
+            return await asyncio.to_thread(_parse_tcy, html, search_url, topic)
         
         except Exception as e:
             logger.error(f"Error scraping TCYOnline for topic {topic}: {str(e)}")
-        
-        return questions
+            return []
     
     async def scrape_prepinsta(self, topic: str) -> List[ScrapedQuestion]:
         """Scrape questions from PrepInsta"""
-        questions = []
         try:
             # PrepInsta specific scraping logic
             topic_slug = topic.lower().replace(' ', '-')
@@ -117,52 +419,16 @@ class WebScraper:
             html = await self.scrape_page(search_url)
             
             if not html:
-                return questions
-            
-            soup = BeautifulSoup(html, 'html.parser')
+                return []
             
-            # Find question containers
-            question_containers = soup.find_all('div', class_='mcq-question')
-            
-            for container in question_containers:
-                try:
-                    question_text = container.find('p', class_='question')
-                    if not question_text:
-                        continue
-                    
-                    options = []
-                    option_elements = container.find_all('li', class_='option')
-                    for opt in option_elements:
-                        options.append(opt.get_text(strip=True))
-                    
-                    # Look for answer explanation
-                    answer_element = container.find('div', class_='answer')
-                    correct_answer = None
-                    if answer_element:
-                        correct_answer = answer_element.get_text(strip=True)
-                    
-                    questions.append(ScrapedQuestion(
-                        question_text=question_text.get_text(strip=True),
-                        options=options if options else None,
-                        correct_answer=correct_answer,
-                        source_url=search_url,
-                        source_name="PrepInsta",
-                        topic=topic,
-                        difficulty="medium"
-                    ))
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing question from PrepInsta: {str(e)}")
-                    continue
+            return await asyncio.to_thread(_parse_prepinsta, html, search_url, topic)
         
         except Exception as e:
             logger.error(f"Error scraping PrepInsta for topic {topic}: {str(e)}")
-        
-        return questions
+            return []
     
     async def scrape_indiabix(self, topic: str) -> List[ScrapedQuestion]:
         """Scrape questions from IndiaBIX"""
-        questions = []
         try:
             # IndiaBIX specific scraping logic
             topic_slug = topic.lower().replace(' ', '-')
@@ -170,56 +436,13 @@ class WebScraper:
             html = await self.scrape_page(search_url)
             
             if not html:
-                return questions
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find question containers
-            question_containers = soup.find_all('div', class_='bix-div-container')
+                return []
             
-            for container in question_containers:
-                try:
-                    question_text = container.find('td', class_='bix-td-qtxt')
-                    if not question_text:
-                        continue
-                    
-                    options = []
-                    option_table = container.find('table', class_='bix-tbl-options')
-                    if option_table:
-                        option_elements = option_table.find_all('td')
-                        for opt in option_elements:
-                            option_text = opt.get_text(strip=True)
-                            if option_text and len(option_text) > 2:  # Filter out empty options
-                                options.append(option_text)
-                    
-                    # Look for correct answer
-                    answer_element = container.find('div', class_='bix-ans-description')
-                    correct_answer = None
-                    if answer_element:
-                        answer_text = answer_element.get_text(strip=True)
-                        # Extract answer from explanation
-                        answer_match = re.search(r'Answer:\s*([A-D])', answer_text)
-                        if answer_match:
-                            correct_answer = answer_match.group(1)
-                    
-                    questions.append(ScrapedQuestion(
-                        question_text=question_text.get_text(strip=True),
-                        options=options if options else None,
-                        correct_answer=correct_answer,
-                        source_url=search_url,
-                        source_name="IndiaBIX",
-                        topic=topic,
-                        difficulty="medium"
-                    ))
-                    
-                except Exception as e:
-                    logger.error(f"Error parsing question from IndiaBIX: {str(e)}")
-                    continue
+            return await asyncio.to_thread(_parse_indiabix, html, search_url, topic)
         
         except Exception as e:
             logger.error(f"Error scraping IndiaBIX for topic {topic}: {str(e)}")
-        
-        return questions
+            return []
     
     async def scrape_reddit_interviews(self, company: str = None) -> List[ScrapedQuestion]:
         """Scrape interview questions from Reddit"""
@@ -227,45 +450,44 @@ class WebScraper:
         try:
             # Reddit API or web scraping for interview experiences
             subreddits = ['cscareerquestions', 'interviews', 'programming']
-            
-            for subreddit in subreddits:
-                search_query = f"interview questions {company}" if company else "interview questions"
-                search_url = f"https://www.reddit.com/r/{subreddit}/search.json?q={search_query}&sort=relevance&limit=25"
-                
-                html = await self.scrape_page(search_url)
-                if not html:
-                    continue
-                
-                # Parse Reddit JSON response
-                import json
-                try:
-                    data = json.loads(html)
-                    posts = data.get('data', {}).get('children', [])
-                    
-                    for post in posts:
-                        post_data = post.get('data', {})
-                        title = post_data.get('title', '')
-                        selftext = post_data.get('selftext', '')
-                        url = f"https://www.reddit.com{post_data.get('permalink', '')}"
-                        
-                        # Extract questions from post content
-                        content = f"{title} {selftext}"
-                        extracted_questions = self._extract_questions_from_text(content)
-                        
-                        for q_text in extracted_questions:
-                            questions.append(ScrapedQuestion(
-                                question_text=q_text,
-                                source_url=url,
-                                source_name="Reddit",
-                                company_name=company,
-                                topic="Interview Experience",
-                                difficulty="medium"
-                            ))
-                
-                except json.JSONDecodeError:
-                    logger.error(f"Error parsing Reddit JSON for subreddit {subreddit}")
-                    continue
-        
+            search_query = f"interview questions {company}" if company else "interview questions"
+
+            # Reddit searches multiple subreddits in one listing via
+            # /r/a+b+c/search, so one request (and one rate-limit token)
+            # replaces a fetch per subreddit; the limit is raised to keep
+            # the overall post volume
+            combined = "+".join(subreddits)
+            search_url = (
+                f"https://www.reddit.com/r/{combined}/search.json"
+                f"?q={search_query}&restrict_sr=on&sort=relevance&limit=75"
+            )
+
+            # JSON endpoint: decode straight from the response bytes
+            # instead of materializing the body as a str and re-parsing
+            data = await self.scrape_json(search_url)
+            if data:
+                posts = data.get('data', {}).get('children', [])
+
+                for post in posts:
+                    post_data = post.get('data', {})
+                    title = post_data.get('title', '')
+                    selftext = post_data.get('selftext', '')
+                    url = f"https://www.reddit.com{post_data.get('permalink', '')}"
+
+                    # Extract questions from post content
+                    content = f"{title} {selftext}"
+                    extracted_questions = self._extract_questions_from_text(content)
+
+                    for q_text in extracted_questions:
+                        questions.append(ScrapedQuestion(
+                            question_text=q_text,
+                            source_url=url,
+                            source_name="Reddit",
+                            company_name=company,
+                            topic="Interview Experience",
+                            difficulty="medium"
+                        ))
+
         except Exception as e:
             logger.error(f"Error scraping Reddit interviews: {str(e)}")
         
@@ -274,45 +496,54 @@ class WebScraper:
     def _extract_questions_from_text(self, text: str) -> List[str]:
         """Extract potential interview questions from text"""
         questions = []
-        
-        # Common question patterns
-        question_patterns = [
-            r'Q\d*[:\.]?\s*(.+?\?)',
-            r'Question\s*\d*[:\.]?\s*(.+?\?)',
-            r'They asked[:\s]*(.+?\?)',
-            r'The interviewer asked[:\s]*(.+?\?)',
-            r'["\'](.+?\?)["\']',
-        ]
-        
-        for pattern in question_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+        seen = set()
+
+        for pattern in _Q_PATTERNS:
+            for match in pattern.findall(text):
                 question = match.strip()
-                if len(question) > 10 and question not in questions:  # Avoid duplicates and too short questions
+                if len(question) > 10 and question.lower() not in seen:  # Avoid duplicates and too short questions
+                    seen.add(question.lower())
                     questions.append(question)
-        
+
         return questions[:5]  # Limit to 5 questions per post
     
     async def scrape_all_sources(self, topic: str, company: str = None) -> List[ScrapedQuestion]:
         """Scrape questions from all sources"""
         all_questions = []
-        
+
+        # Cap how many sources run at once: the per-host token buckets
+        # pace requests to each site, while this bounds the total number
+        # of in-flight scrapes regardless of how many sources get added
+        sem = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+        async def _guarded(coro):
+            async with sem:
+                return await coro
+
         # Scrape from different sources concurrently
         tasks = [
-            self.scrape_tcyonline(topic),
-            self.scrape_prepinsta(topic),
-            self.scrape_indiabix(topic),
+            _guarded(self.scrape_tcyonline(topic)),
+            _guarded(self.scrape_prepinsta(topic)),
+            _guarded(self.scrape_indiabix(topic)),
         ]
-        
+
         if company:
-            tasks.append(self.scrape_reddit_interviews(company))
-        
+            tasks.append(_guarded(self.scrape_reddit_interviews(company)))
+
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+
+        # Deduplicate while accumulating: O(1) set probes here instead of
+        # quadratic scans somewhere downstream
+        seen = set()
         for result in results:
             if isinstance(result, list):
-                all_questions.extend(result)
+                for question in result:
+                    key = (question.source_name, question.question_text.lower())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    all_questions.append(question)
             elif isinstance(result, Exception):
                 logger.error(f"Scraping task failed: {str(result)}")
-        
+
         return all_questions
\ No newline at end of file
@@ -0,0 +1,60 @@
+import orjson
+import redis.asyncio as aioredis
+from typing import Dict, List
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.topic import Topic
+
+logger = logging.getLogger(__name__)
+
+# Topics are near-static reference data queried on every quiz build; a short
+# TTL keeps reads off the database without risking stale lists for long
+TOPIC_CACHE_KEY = "topics:all"
+TOPIC_CACHE_TTL = 60
+
+class TopicService:
+    def __init__(self):
+        self.redis = aioredis.Redis.from_url(settings.REDIS_URL)
+
+    async def list_topics_cached(self, db: AsyncSession) -> List[Dict]:
+        """Return all topics, served from Redis when the cache is warm"""
+        try:
+            cached = await self.redis.get(TOPIC_CACHE_KEY)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"Topic cache read failed: {str(e)}")
+
+        result = await db.execute(select(Topic))
+        data = [
+            {
+                "id": topic.id,
+                "name": topic.name,
+                "description": topic.description,
+                "category": topic.category,
+                "is_default": topic.is_default,
+                "difficulty_level": topic.difficulty_level
+            }
+            for topic in result.scalars()
+        ]
+
+        try:
+            await self.redis.setex(TOPIC_CACHE_KEY, TOPIC_CACHE_TTL, orjson.dumps(data))
+        except Exception as e:
+            logger.warning(f"Topic cache write failed: {str(e)}")
+
+        return data
+
+    async def invalidate_topics(self):
+        """Drop the cached topic list (call after topic create/update/delete)"""
+        try:
+            await self.redis.delete(TOPIC_CACHE_KEY)
+        except Exception as e:
+            logger.warning(f"Topic cache invalidation failed: {str(e)}")
+
+# Global topic service instance
+topic_service = TopicService()
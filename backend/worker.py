@@ -0,0 +1,34 @@
+"""Standalone scheduler worker.
+
+Runs the background scheduler in its own process so that API deployments
+with multiple uvicorn workers do not each spawn a competing scheduler
+(racing to create the same quiz schedules and double-sending
+notifications). Start with:
+
+    python worker.py
+"""
+import asyncio
+import logging
+
+import uvloop
+
+from app.services.scheduler import scheduler_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def main():
+    logger.info("Starting scheduler worker...")
+    await scheduler_service.start()
+
+    # start() only spawns the background tasks; keep the process alive
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await scheduler_service.stop()
+
+if __name__ == "__main__":
+    # libuv-backed event loop; uvicorn already picks uvloop up for the API
+    uvloop.install()
+    asyncio.run(main())